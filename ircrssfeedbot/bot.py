@@ -1,6 +1,9 @@
 """Bot."""
+import asyncio
+import concurrent.futures
 import datetime
 import fnmatch
+import functools
 import logging
 import os
 import queue
@@ -8,7 +11,7 @@ import random
 import subprocess
 import threading
 import time
-from typing import Callable, Dict, List, Tuple
+from typing import Callable, Coroutine, Dict, List, Tuple
 
 import bitlyshortener
 import ircstyle
@@ -16,12 +19,13 @@ import miniirc
 
 from . import config, publishers, searchers
 from .db import Database
-from .feed import FeedReader
+from .feed import Feed, FeedReader
 from .url import URLReader
+from .util.asyncio import Barrier
 from .util.datetime import timedelta_desc
 from .util.humanize import humanize_bytes
 from .util.list import ensure_list
-from .util.str import list_irc_modes
+from .util.str import list_irc_modes, readable_list
 
 log = logging.getLogger(__name__)
 
@@ -30,18 +34,22 @@ class Bot:
     """Bot."""
 
     CHANNEL_BUSY_LOCKS: Dict[str, threading.Lock] = {}
-    CHANNEL_JOIN_EVENTS: Dict[str, threading.Event] = {}
+    CHANNEL_JOIN_EVENTS: Dict[str, asyncio.Event] = {}
     CHANNEL_LAST_INCOMING_MSG_TIMES: Dict[str, float] = {}
-    CHANNEL_QUEUES: Dict[str, queue.Queue] = {}
+    CHANNEL_QUEUES: Dict[str, asyncio.Queue] = {}
+    EVENT_LOOP: asyncio.AbstractEventLoop = asyncio.new_event_loop()  # Runs all channel messengers and feed readers.
     EXITCODE_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
     SEARCH_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
-    FEED_GROUP_BARRIERS: Dict[str, threading.Barrier] = {}
+    FEED_GROUP_BARRIERS: Dict[str, Barrier] = {}
 
     def __init__(self) -> None:
         log.info(f"Initializing bot as: {subprocess.check_output('id', text=True).rstrip()}")  # pylint: disable=unexpected-keyword-arg
         instance = config.INSTANCE
         self._active = True
-        self._outgoing_msg_lock = threading.Lock()  # Used for rate limiting across multiple channels.
+        asyncio.set_event_loop(self.EVENT_LOOP)  # Binds asyncio primitives that are created in this thread to the loop.
+        self._feed_read_executor = concurrent.futures.ThreadPoolExecutor(max_workers=config.READ_THREADS_MAX, thread_name_prefix="FeedReader")
+        self._feed_post_executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(instance["feeds"]), thread_name_prefix="FeedPoster")  # A channel posts one feed at a time.
+        self._task_futures: List[concurrent.futures.Future] = []  # Futures of the channel messengers and feed readers.
         self._db = Database()
         self._url_shortener = bitlyshortener.Shortener(
             tokens=[token.strip() for token in os.environ["BITLY_TOKENS"].strip().split(",")], max_cache_size=config.CACHE_MAXSIZE__BITLY_SHORTENER
@@ -66,6 +74,7 @@ class Bot:
             ping_interval=30,
         )
         log.info("Initialized IRC client.")
+        threading.Thread(target=self.EVENT_LOOP.run_forever, name="EventLoop").start()
         self._setup_alerter()
         self._setup_channels()
         self._log_config()
@@ -173,71 +182,95 @@ class Bot:
         if searchers_ := self._searchers:
             log.info(f"Search commands will be accepted as private messages or directed public messages for the sources: {', '.join(searchers_)}")
 
-    def _msg_channel(self, channel: str) -> None:  # pylint: disable=too-many-branches,too-many-locals,too-many-statements
+    async def _msg_channel(self, channel: str) -> None:  # pylint: disable=too-many-branches,too-many-locals,too-many-statements
         log.debug(f"Channel messenger for {channel} is starting and is waiting to be notified of channel join.")
         instance = config.INSTANCE
         alerter = config.runtime.alert
-        outgoing_msg_lock = self._outgoing_msg_lock
+        loop = self.EVENT_LOOP
         channel_busy_lock = self.CHANNEL_BUSY_LOCKS[channel]
         channel_queue = self.CHANNEL_QUEUES[channel]
         irc = self._irc
-        self.CHANNEL_JOIN_EVENTS[channel].wait()
-        self.CHANNEL_JOIN_EVENTS[instance["alerts_channel"]].wait()
+
+        def post_feed(feed_: Feed) -> None:  # Blocking, and so it is run in an executor.
+            with channel_busy_lock:
+                feed_.post()
+                feed_.mark_posted()
+                feed_.publish()
+
+        await self.CHANNEL_JOIN_EVENTS[channel].wait()
+        await self.CHANNEL_JOIN_EVENTS[instance["alerts_channel"]].wait()
         log.info(f"Channel messenger for {channel} has started.")
         while self._active:  # pylint: disable=too-many-nested-blocks
-            feed = channel_queue.get()
-            log.debug(f"Dequeued {feed}.")
-            min_channel_idle_time = feed.reader.min_channel_idle_time
-            log.debug(f"The minimum required channel idle time for {feed} is {timedelta_desc(min_channel_idle_time)}.")
+            feeds = [await channel_queue.get()]
+            while not channel_queue.empty():  # Drains immediately available feeds so that they are prepared together.
+                feeds.append(channel_queue.get_nowait())
+            log.debug(f"Dequeued {readable_list(feeds)}.")
             try:
-                if not feed.is_postable:
-                    feed.mark_posted()  # channel_busy_lock is not acquired here because there are no posts.
-                else:
-                    try:
-                        while True:
-                            if not outgoing_msg_lock.acquire(blocking=False):
-                                log.info(f"Waiting to acquire outgoing message lock to post {feed}.")
-                                outgoing_msg_lock.acquire()
-                            last_incoming_msg_time = Bot.CHANNEL_LAST_INCOMING_MSG_TIMES[channel]
-                            time_elapsed_since_last_ic_msg = time.monotonic() - last_incoming_msg_time
-                            sleep_time = max(0, min_channel_idle_time - time_elapsed_since_last_ic_msg)
-                            if sleep_time == 0:
-                                break  # Lock will be released later after posting messages.
-                            outgoing_msg_lock.release()  # Releasing lock before sleeping.
-                            log.info(f"Will wait {timedelta_desc(sleep_time)} for channel inactivity to post {feed}.")
-                            time.sleep(sleep_time)
+                await loop.run_in_executor(None, self._prepare_batch, feeds)  # Blocking as it uses the database and the URL shortener.
+            except Exception as exc:  # pylint: disable=broad-except
+                alerter(f"Error preparing {readable_list(feeds)}: {exc}")
+                for _ in feeds:
+                    channel_queue.task_done()
+                continue
+
+            for feed in feeds:
+                min_channel_idle_time = feed.reader.min_channel_idle_time
+                log.debug(f"The minimum required channel idle time for {feed} is {timedelta_desc(min_channel_idle_time)}.")
+                try:
+                    if not feed.is_postable:  # Not blocking as the postable entries were retrieved by _prepare_batch.
+                        await loop.run_in_executor(None, feed.mark_posted)  # channel_busy_lock is not acquired here because there are no posts.
+                    else:
+                        await self._wait_for_channel_idle(channel, min_channel_idle_time, feed)
 
                         log.debug("Checking IRC client connection state.")
                         if not irc.connected:  # In case of netsplit.
                             log.warning(f"Will wait for IRC client to connect so as to post {feed}.")
                             disconnect_time = time.monotonic()
                             while not irc.connected:
-                                time.sleep(5)
+                                await asyncio.sleep(5)
                             disconnection_time = time.monotonic() - disconnect_time
                             log.info(f"IRC client is connected after waiting {timedelta_desc(disconnection_time)}.")
 
-                        with channel_busy_lock:
-                            feed.post()
-                            feed.mark_posted()
-                            feed.publish()
-                    finally:
-                        outgoing_msg_lock.release()
-            except Exception as exc:  # pylint: disable=broad-except
-                msg = f"Error processing {feed}: {exc}"
-                alerter(msg)
-            channel_queue.task_done()
+                        await loop.run_in_executor(self._feed_post_executor, post_feed, feed)  # Messages are rate limited across channels by a token bucket.
+                except Exception as exc:  # pylint: disable=broad-except
+                    msg = f"Error processing {feed}: {exc}"
+                    alerter(msg)
+                channel_queue.task_done()
         log.debug(f"Channel messenger for {channel} has stopped.")
 
-    def _read_feed(self, channel: str, feed_name: str) -> None:  # pylint: disable=too-many-locals,too-many-statements
+    @staticmethod
+    async def _wait_for_channel_idle(channel: str, min_channel_idle_time: float, feed: Feed) -> None:
+        """Wait until the channel has had no incoming message for the given minimum idle time."""
+        # Note: The deadline is recomputed only upon waking at it, as incoming messages can only postpone it.
+        while (sleep_time := Bot.CHANNEL_LAST_INCOMING_MSG_TIMES[channel] + min_channel_idle_time - time.monotonic()) > 0:
+            log.info(f"Will wait {timedelta_desc(sleep_time)} for channel inactivity to post {feed}.")
+            await asyncio.sleep(sleep_time)
+
+    async def _adapted_feed_period(self, channel: str, feed_name: str, feed_period_configured: float, feed_period_adaptive_max: float) -> float:
+        """Return the average feed period adapted to the post interval of the feed if it is known, otherwise the configured period."""
+        try:
+            post_interval = await self.EVENT_LOOP.run_in_executor(None, self._db.select_post_interval, channel, feed_name)
+        except Exception as exc:  # pylint: disable=broad-except
+            log.error(f"Failed to select the post interval of feed {feed_name} of {channel}, and so its configured period will be used: {exc}")
+            return feed_period_configured
+        if post_interval is None:
+            return feed_period_configured
+        feed_period_avg = min(max(feed_period_configured, post_interval / 2), feed_period_adaptive_max)
+        log.debug(f"Adapted average period of feed {feed_name} of {channel} to {timedelta_desc(feed_period_avg)} for post interval {timedelta_desc(post_interval)}.")
+        return feed_period_avg
+
+    async def _read_feed(self, channel: str, feed_name: str) -> None:  # pylint: disable=too-many-locals,too-many-statements
         log.debug(f"Feed reader for feed {feed_name} of {channel} is starting and is waiting to be notified of channel join.")
         instance = config.INSTANCE
         alerter = config.runtime.alert
         feed_config = instance["feeds"][channel][feed_name]
 
         channel_queue = Bot.CHANNEL_QUEUES[channel]
-        feed_period_avg = max(config.PERIOD_HOURS_MIN, feed_config.get("period", config.PERIOD_HOURS_DEFAULT)) * 3600
+        feed_period_configured = max(config.PERIOD_HOURS_MIN, feed_config.get("period", config.PERIOD_HOURS_DEFAULT)) * 3600
+        feed_period_adaptive_max = max(feed_period_configured, config.PERIOD_HOURS_ADAPTIVE_MAX * 3600)
+        is_feed_period_adaptive = not feed_config.get("group")  # A grouped feed must not hold up the other feeds in its group.
+        feed_period_avg = feed_period_configured
         feed_period_min = feed_period_avg * (1 - config.PERIOD_RANDOM_PERCENT / 100)
-        feed_period_max = feed_period_avg * (1 + config.PERIOD_RANDOM_PERCENT / 100)
 
         num_consecutive_failures = 0
         last_failure_alert_time = float("-inf")
@@ -254,21 +287,23 @@ class Bot:
         log.debug(f"Feed reader for feed {feed_name} of {channel} has initialized and is waiting to be notified of channel join.")
 
         query_time = time.monotonic() - (feed_period_avg / 2)  # Delays first read by half of feed period.
-        self.CHANNEL_JOIN_EVENTS[channel].wait()
-        self.CHANNEL_JOIN_EVENTS[instance["alerts_channel"]].wait()
+        await self.CHANNEL_JOIN_EVENTS[channel].wait()
+        await self.CHANNEL_JOIN_EVENTS[instance["alerts_channel"]].wait()
         log.debug(f"Feed reader for feed {feed_name} of {channel} has started.")
         while self._active:
-            feed_period = random.uniform(feed_period_min, feed_period_max)
+            if is_feed_period_adaptive:
+                feed_period_avg = await self._adapted_feed_period(channel, feed_name, feed_period_configured, feed_period_adaptive_max)
+            feed_period = feed_period_avg * random.uniform(1 - config.PERIOD_RANDOM_PERCENT / 100, 1 + config.PERIOD_RANDOM_PERCENT / 100)
             query_time = max(time.monotonic(), query_time + feed_period)  # "max" is used in case of wait using "put".
             sleep_time = max(0.0, query_time - time.monotonic())
             if sleep_time != 0:
                 log.debug(f"Will wait {timedelta_desc(sleep_time)} to read feed {feed_name} of {channel}.")
-                time.sleep(sleep_time)
+                await asyncio.sleep(sleep_time)
 
             try:
                 # Read feed
                 log.debug(f"Retrieving feed {feed_name} of {channel}.")
-                feed = feed_reader.read()
+                feed = await self.EVENT_LOOP.run_in_executor(self._feed_read_executor, feed_reader.read)
                 log.info(f"Retrieved in {feed.read_time_used:.1f}s the {feed} with {len(feed.entries)} approved entries via {feed.read_approach}.")
 
                 # Wait for other feeds in group
@@ -277,23 +312,23 @@ class Bot:
                     group_barrier = Bot.FEED_GROUP_BARRIERS[feed_group]
                     num_other = group_barrier.parties - 1
                     num_pending = num_other - group_barrier.n_waiting
-                    if num_pending > 0:  # This is not thread-safe but that's okay for logging.
+                    if num_pending > 0:
                         log.debug(f"Will wait for {num_pending} of {num_other} other feeds in group {feed_group} to also be read before queuing {feed}.")
-                    group_barrier.wait()
+                    await group_barrier.wait()
                     log.debug(f"Finished waiting for other feeds in group {feed_group} to also be read before queuing {feed}.")
 
                 # Queue feed
                 # FIXME: This doesn't work correctly when `feed_reader.min_channel_idle_time == 0`.
                 try:
                     channel_queue.put_nowait(feed)
-                except queue.Full:
+                except asyncio.QueueFull:
                     msg = (
                         f"The {feed} cannot currently be queued for being posted to {channel}, "
                         f"perhaps because the channel has been too active. "
                         f"The queue for this channel is full. The feed will be put in the queue in blocking mode."
                     )
                     alerter(msg, log.warning)
-                    channel_queue.put(feed)
+                    await channel_queue.put(feed)
                 log.debug(f"Queued {feed}.")
             except Exception as exc:  # pylint: disable=broad-except
                 num_consecutive_failures += 1
@@ -319,6 +354,35 @@ class Bot:
                 num_consecutive_failures = 0
         log.debug(f"Feed reader for feed {feed_name} of {channel} has stopped.")
 
+    def _prepare_batch(self, feeds: List[Feed]) -> None:
+        """Retrieve the unposted entries of the given feeds of a channel, and shorten the long URLs of their postable entries, each together.
+
+        The feeds can include multiple reads of a feed. The entries of each feed exclude those unposted for the preceding feeds, and so they are posted only once.
+        """
+        Feed.prefetch_unposted_entries(feeds)
+        # Note: The postable entries are intentionally retrieved for all feeds, irrespective of whether their URLs are to be shortened.
+        entries = [entry for feed in feeds for entry in feed.postable_entries if feed.reader.config["shorten"] and (entry.short_url is None)]
+        if not entries:
+            return
+        log.debug(f"Shortening {len(entries)} postable long URLs for {readable_list(feeds)}.")
+        short_urls = self._url_shortener.shorten_urls([entry.long_url for entry in entries])
+        for entry, short_url in zip(entries, short_urls):
+            entry.short_url = short_url
+        log.debug(f"Shortened {len(entries)} postable long URLs for {readable_list(feeds)}.")
+
+    @staticmethod
+    def _alert_on_task_exception(description: str, future: concurrent.futures.Future) -> None:
+        """Alert if the given completed future of a task has an exception, as it is otherwise not logged."""
+        if (not future.cancelled()) and ((exc := future.exception()) is not None):
+            logger = functools.partial(log.error, exc_info=exc)  # log.exception is not usable outside of an exception handler.
+            config.runtime.alert(f"The {description} has stopped due to an error: {exc.__class__.__qualname__}: {exc}", logger)
+
+    def _start_task(self, coroutine: Coroutine, description: str) -> None:
+        """Start the given coroutine as a task in the event loop, alerting if it stops due to an error."""
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.EVENT_LOOP)
+        future.add_done_callback(functools.partial(self._alert_on_task_exception, description))
+        self._task_futures.append(future)
+
     def _setup_alerter(self) -> None:
         def alerter(msg: str, logger: Callable[[str], None] = log.exception) -> None:
             logger(msg)
@@ -330,20 +394,20 @@ class Bot:
         instance = config.INSTANCE
         channels = instance["feeds"]
         channels_str = ", ".join(channels)
-        log.debug("Setting up threads and queues for %s channels (%s) and their feeds with %s currently active " "threads.", len(channels), channels_str, threading.active_count())
+        log.debug("Setting up tasks and queues for %s channels (%s) and their feeds with %s currently active threads.", len(channels), channels_str, threading.active_count())
         num_feeds_setup = 0
         num_urls = 0
         num_reads_daily = 0
         barriers_parties: Dict[str, int] = {}
         for channel, channel_config in channels.items():
-            log.debug("Setting up threads and queue for %s.", channel)
+            log.debug("Setting up tasks and queue for %s.", channel)
             num_channel_feeds = len(channel_config)
             self.CHANNEL_BUSY_LOCKS[channel] = threading.Lock()
-            self.CHANNEL_JOIN_EVENTS[channel] = threading.Event()
-            self.CHANNEL_QUEUES[channel] = queue.Queue(maxsize=num_channel_feeds * 2)
-            threading.Thread(target=self._msg_channel, name=f"ChannelMessenger-{channel}", args=(channel,)).start()
+            self.CHANNEL_JOIN_EVENTS[channel] = asyncio.Event()
+            self.CHANNEL_QUEUES[channel] = asyncio.Queue(maxsize=num_channel_feeds * 2)
+            self._start_task(self._msg_channel(channel), f"channel messenger for {channel}")
             for feed, feed_config in channel_config.items():
-                threading.Thread(target=self._read_feed, name=f"FeedReader-{channel}-{feed}", args=(channel, feed)).start()
+                self._start_task(self._read_feed(channel, feed), f"feed reader for feed {feed} of {channel}")
                 num_feed_urls = len(ensure_list(feed_config["url"]))
                 num_urls += num_feed_urls
                 feed_period = max(config.PERIOD_HOURS_MIN, feed_config.get("period", config.PERIOD_HOURS_DEFAULT))
@@ -353,9 +417,9 @@ class Bot:
                     group = feed_config["group"]
                     barriers_parties[group] = barriers_parties.get(group, 0) + 1
                 num_feeds_setup += 1
-            log.debug("Finished setting up threads and queue for %s and its %s feeds with %s currently active threads.", channel, num_channel_feeds, threading.active_count())
+            log.debug("Finished setting up tasks and queue for %s and its %s feeds with %s currently active threads.", channel, num_channel_feeds, threading.active_count())
         for barrier, parties in barriers_parties.items():
-            self.FEED_GROUP_BARRIERS[barrier] = threading.Barrier(parties)
+            self.FEED_GROUP_BARRIERS[barrier] = Barrier(parties)
 
         # Log counts
         log.info(
@@ -412,7 +476,7 @@ def _handle_join(_irc: miniirc.IRC, hostmask: Tuple[str, str, str], args: List[s
         return
 
     # Update channel last message time
-    Bot.CHANNEL_JOIN_EVENTS[channel].set()
+    Bot.EVENT_LOOP.call_soon_threadsafe(Bot.CHANNEL_JOIN_EVENTS[channel].set)
     Bot.CHANNEL_LAST_INCOMING_MSG_TIMES[channel] = msg_time = time.monotonic()
     log.debug(f"Set the last incoming message time for {channel} to {msg_time}.")
 
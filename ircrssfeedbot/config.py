@@ -28,7 +28,9 @@ GiB = 1024 ** 3  # pylint: disable=invalid-name
 # Main
 ALERTS_CHANNEL_FORMAT_DEFAULT: Final = "##{nick}-alerts"
 CACHE_MAXSIZE__BITLY_SHORTENER: Final = CACHE_MAXSIZE_DEFAULT
-CACHE_MAXSIZE__INT8HASH: Final = CACHE_MAXSIZE_DEFAULT
+CACHE_MAXSIZE__FEED_URL_PARSES: Final = 64  # Per feed reader. Only the URL content hashes and followable URLs are cached.
+CACHE_MAXSIZE__HTML_TO_TEXT: Final = CACHE_MAXSIZE_DEFAULT * 8
+CACHE_MAXSIZE__INT8HASH: Final = CACHE_MAXSIZE_DEFAULT * 32  # The URLs of all feeds are hashed for each of their reads.
 CACHE_MAXSIZE__URL_COMPRESSION: Final = 4
 CACHE_MAXSIZE__URL_GOOGLE_NEWS: Final = CACHE_MAXSIZE_DEFAULT
 CACHE_MAXSIZE__URL_NETLOC: Final = CACHE_MAXSIZE_DEFAULT
@@ -53,18 +55,24 @@ ETAG_CACHE_PROHIBITED_NETLOCS: Final = {
 ETAG_TEST_PROBABILITY: Final = 0.1
 FEED_DEFAULTS: Final = {"new": "some", "shorten": True}
 IRC_COLORS: Final = set(ircstyle.colors.idToName.values())
+MESSAGES_BURST_MAX: Final = 5
 MIN_CHANNEL_IDLE_TIME_DEFAULT: Final = {"dev": 1}.get(ENV, 15 * 60)
 MIN_CONSECUTIVE_FEED_FAILURES_FOR_ALERT: Final = 3
 MIN_FEED_INTERVAL_FOR_REPEATED_ALERT: Final = 15 * 60
 NEW_FEED_POSTS_MAX: Final = {"none": 0, "some": 3, "all": None}
+PERIOD_ADAPTIVE_MIN_POST_INTERVALS: Final = 3  # Minimum number of observed intervals between posts for adapting the period of a feed.
+PERIOD_HOURS_ADAPTIVE_MAX: Final = 8  # The period of a feed is adapted upward from its configured period toward half its average interval between posts.
 PERIOD_HOURS_DEFAULT: Final = 1
 PERIOD_HOURS_MIN: Final = {"dev": 0.0001}.get(ENV, 0.2)
 PERIOD_RANDOM_PERCENT: Final = 5
+POST_INTERVAL_EWMA_ALPHA: Final = 0.3
 PUBLISH_ATTEMPTS_MAX: Final = 2
 PUBLISH_THREADS_MAX: Final = 4
 PUBLISH_RETRY_SLEEP_MAX: Final = 60
 QUOTE_LEN_MAX: Final = 510  # Leaving 2 for "\r\n".
 READ_ATTEMPTS_MAX: Final = 3
+READ_THREADS_MAX: Final = 32
+READ_URL_THREADS_MAX: Final = 16  # Used for reading URLs having different hosts concurrently.
 REQUEST_TIMEOUT: Final = 90
 SEARCH_CACHE_MAXSIZE: Final = 256
 SEARCH_CACHE_TTL: Final = 3600 * 8
@@ -1,7 +1,11 @@
 """Database interface."""
 import logging
+import tempfile
 import threading
-from typing import List, Set
+import time
+import unittest
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
 
 import peewee
 from peewee import chunked
@@ -31,6 +35,21 @@ class Post(peewee.Model):
         )  # True means unique.
 
 
+class PostInterval(peewee.Model):
+    """Post interval table."""
+
+    channel = peewee.BigIntegerField(null=False, verbose_name="signed hash of channel name")
+    feed = peewee.BigIntegerField(null=False, verbose_name="signed hash of feed name")
+    last_post_time = peewee.DoubleField(null=False, verbose_name="time of last post in seconds since epoch")
+    interval_ewma = peewee.DoubleField(null=True, verbose_name="exponentially weighted moving average of seconds between posts")
+    num_intervals = peewee.IntegerField(null=False, default=0, verbose_name="number of observed intervals between posts")
+
+    class Meta:  # pylint: disable=missing-class-docstring
+        database = _DATABASE
+        legacy_table_names = False  # This will become a default in peewee>=4
+        primary_key = peewee.CompositeKey("channel", "feed")
+
+
 class Database:
     """Database interface via an ORM."""
 
@@ -38,9 +57,10 @@ class Database:
         # Initialize db
         log.debug("Initializing database.")
         db_path = config.INSTANCE["dir"] / config.DB_FILENAME
-        _DATABASE.init(db_path)  # If facing threading issues, consider https://stackoverflow.com/a/39024742/
+        pragmas = {"journal_mode": "wal", "synchronous": "normal", "temp_store": "memory"}  # Applied to each connection. WAL avoids an fsync of the db per commit.
+        _DATABASE.init(db_path, pragmas=pragmas)  # If facing threading issues, consider https://stackoverflow.com/a/39024742/
         self._db = _DATABASE
-        self._db.create_tables([Post])
+        self._db.create_tables([Post, PostInterval])
         self._write_lock = threading.Lock()  # Unclear if necessary, but used anyway for safety.
         log.info("Initialized database having path %s.", db_path)
 
@@ -60,39 +80,69 @@ class Database:
         # Helper function:
         # sql = lambda *s: list(self._db.execute_sql(*s))
 
-    @staticmethod
-    def _select_unposted(conditions: peewee.Expression, urls: List[str]) -> List[str]:
-        hashes2urls = Int8Hash.as_dict(urls)
-        posted_hashes: Set[int] = set()
-        for hashes_batch in chunked(hashes2urls, 100):  # Ref: https://www.sqlite.org/limits.html#max_variable_number
-            conditions_batch = conditions & Post.url.in_(hashes_batch)
-            posted_hashes |= {post[0] for post in Post.select(Post.url).where(conditions_batch).tuples().iterator()}
-        unposted_urls = [url for url_hash, url in hashes2urls.items() if url_hash not in posted_hashes]
-        return unposted_urls
-
     @staticmethod
     def is_new_feed(channel: str, feed: str) -> bool:
         """Return whether the specified feed name is new or not by checking whether it has entries in the database."""
         conditions = (Post.channel == Int8Hash.as_int(channel)) & (Post.feed == Int8Hash.as_int(feed))
         return not Post.select(Post.url).where(conditions).limit(1)
 
-    def select_unposted_for_channel(self, channel: str, feed: str, urls: List[str]) -> List[str]:
-        """Return unposted URLs for the given channel."""
-        log.debug("Retrieving unposted URLs from the database for channel %s having ignored feed %s out of %s URLs.", channel, feed, len(urls))
-        conditions = Post.channel == Int8Hash.as_int(channel)
-        unposted_urls = self._select_unposted(conditions, urls)
-        loglevel = logging.INFO if len(unposted_urls) > 0 else logging.DEBUG
-        log.log(loglevel, "Returning %s unposted URLs from the database for channel %s having ignored feed %s out of %s URLs.", len(unposted_urls), channel, feed, len(urls))
-        return unposted_urls
-
-    def select_unposted_for_channel_feed(self, channel: str, feed: str, urls: List[str]) -> List[str]:
-        """Return unposted URLs for the given channel and feed."""
-        log.debug("Retrieving unposted URLs from the database for channel %s having feed %s out of %s URLs.", channel, feed, len(urls))
-        conditions = (Post.channel == Int8Hash.as_int(channel)) & (Post.feed == Int8Hash.as_int(feed))
-        unposted_urls = self._select_unposted(conditions, urls)
-        loglevel = logging.INFO if len(unposted_urls) > 0 else logging.DEBUG
-        log.log(loglevel, "Returning %s unposted URLs from the database for channel %s having feed %s out of %s URLs.", len(unposted_urls), channel, feed, len(urls))
-        return unposted_urls
+    @staticmethod
+    def select_post_interval(channel: str, feed: str) -> Optional[float]:
+        """Return the moving average of the seconds between posts for the given channel and feed if enough posts have been observed, otherwise None."""
+        conditions = (PostInterval.channel == Int8Hash.as_int(channel)) & (PostInterval.feed == Int8Hash.as_int(feed))
+        post_interval = PostInterval.get_or_none(conditions)
+        if (post_interval is None) or (post_interval.num_intervals < config.PERIOD_ADAPTIVE_MIN_POST_INTERVALS):
+            return None
+        return post_interval.interval_ewma
+
+    @staticmethod
+    def _update_post_interval(channel_hash: int, feed_hash: int) -> None:
+        now = time.time()
+        conditions = (PostInterval.channel == channel_hash) & (PostInterval.feed == feed_hash)
+        if (post_interval := PostInterval.get_or_none(conditions)) is None:
+            PostInterval.insert(channel=channel_hash, feed=feed_hash, last_post_time=now).execute()  # pylint: disable=no-value-for-parameter
+            return
+        interval = now - post_interval.last_post_time
+        if post_interval.interval_ewma is not None:
+            interval = config.POST_INTERVAL_EWMA_ALPHA * interval + (1 - config.POST_INTERVAL_EWMA_ALPHA) * post_interval.interval_ewma
+        updates = {PostInterval.last_post_time: now, PostInterval.interval_ewma: interval, PostInterval.num_intervals: PostInterval.num_intervals + 1}
+        PostInterval.update(updates).where(conditions).execute()
+
+    def select_unposted(self, channel: str, requests: List[Tuple[str, str, List[str]]]) -> List[List[str]]:  # pylint: disable=too-many-locals
+        """Return the unposted URLs for each of the given requests for the given channel.
+
+        Each request is a tuple of a feed name, a dedup strategy which is either `channel` or `feed`, and a list of URLs.
+        The requests share a single query for each batch of URLs.
+        The unposted URLs of each request are treated as posted for the subsequent requests, as if each request were marked as posted before the next one.
+        The returned URLs of each request are in the order of its given URLs.
+        """
+        log.debug("Retrieving unposted URLs from the database for channel %s for %s feeds having %s URLs.", channel, len(requests), sum(len(urls) for _, _, urls in requests))
+        requests_hashes2urls = [Int8Hash.as_dict(urls) for _, _, urls in requests]
+        url_hashes: Set[int] = set().union(*requests_hashes2urls)
+        posted_feed_hashes: Dict[int, Set[int]] = {}  # Maps URL hashes to feed hashes.
+        channel_conditions = Post.channel == Int8Hash.as_int(channel)
+        for hashes_batch in chunked(url_hashes, 100):  # Ref: https://www.sqlite.org/limits.html#max_variable_number
+            conditions_batch = channel_conditions & Post.url.in_(hashes_batch)
+            for feed_hash, url_hash in Post.select(Post.feed, Post.url).where(conditions_batch).tuples().iterator():
+                posted_feed_hashes.setdefault(url_hash, set()).add(feed_hash)
+
+        requests_unposted_urls = []
+        for (feed, dedup_strategy, urls), hashes2urls in zip(requests, requests_hashes2urls):
+            feed_hash = Int8Hash.as_int(feed)
+            if dedup_strategy == "channel":
+                feed_desc = f"ignored feed {feed}"
+                unposted_hashes2urls = {url_hash: url for url_hash, url in hashes2urls.items() if url_hash not in posted_feed_hashes}
+            else:
+                assert dedup_strategy == "feed"
+                feed_desc = f"feed {feed}"
+                unposted_hashes2urls = {url_hash: url for url_hash, url in hashes2urls.items() if feed_hash not in posted_feed_hashes.get(url_hash, ())}
+            for url_hash in unposted_hashes2urls:  # Claims the URLs for this request.
+                posted_feed_hashes.setdefault(url_hash, set()).add(feed_hash)
+            unposted_urls = list(unposted_hashes2urls.values())
+            loglevel = logging.INFO if len(unposted_urls) > 0 else logging.DEBUG
+            log.log(loglevel, "Returning %s unposted URLs from the database for channel %s having %s out of %s URLs.", len(unposted_urls), channel, feed_desc, len(urls))
+            requests_unposted_urls.append(unposted_urls)
+        return requests_unposted_urls
 
     def insert_posted(self, channel: str, feed: str, urls: List[str]) -> None:
         """Insert the given URLs for the given channel and feed."""
@@ -104,4 +154,40 @@ class Database:
                 Post.insert_many(batch).execute()  # pylint: disable=no-value-for-parameter
                 # Note: "sqlite3.IntegrityError: UNIQUE constraint failed" would be indicative of a bug elsewhere.
                 # As such, prepending ".on_conflict_ignore()" before ".execute()" should not be needed.
+            if urls:
+                self._update_post_interval(channel_hash, feed_hash)
         log.info("Inserted %s URLs into the database for channel %s having feed %s.", len(urls), channel, feed)
+
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+class TestDatabase(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self._instance = config.INSTANCE
+        config.INSTANCE = {"dir": Path(self._temp_dir.name)}
+        self.db = Database()
+
+    def tearDown(self):
+        _DATABASE.close()
+        config.INSTANCE = self._instance
+        self._temp_dir.cleanup()
+
+    def test_select_unposted(self):
+        channel = "#some-channel"
+        self.db.insert_posted(channel, "a", ["https://x/1"])
+        requests = [
+            ("a", "channel", ["https://x/1", "https://x/2", "https://x/3"]),
+            ("a", "channel", ["https://x/2", "https://x/4"]),  # Repeated feed.
+            ("b", "channel", ["https://x/3", "https://x/5"]),  # Shares a URL with feed a.
+            ("c", "feed", ["https://x/1", "https://x/3"]),
+            ("c", "feed", ["https://x/3", "https://x/6"]),  # Repeated feed.
+        ]
+        expected_unposted_urls = [["https://x/2", "https://x/3"], ["https://x/4"], ["https://x/5"], ["https://x/1", "https://x/3"], ["https://x/6"]]
+        requests_unposted_urls = self.db.select_unposted(channel, requests)
+        self.assertEqual(requests_unposted_urls, expected_unposted_urls)
+        for (feed, _, _), unposted_urls in zip(requests, requests_unposted_urls):
+            self.db.insert_posted(channel, feed, unposted_urls)  # Would raise IntegrityError if a URL were returned twice for a feed.
+        self.assertEqual(self.db.select_unposted(channel, requests), [[], [], [], [], []])
+
+
+# python -m unittest -v ircrssfeedbot.db
@@ -2,10 +2,11 @@
 import dataclasses
 import logging
 import re
-from typing import Any, Dict, List, Optional, Pattern, Tuple
+from typing import Any, Dict, List, Optional, Pattern
 
 from . import config
 from .style import style
+from .util.dataclasses import add_slots
 from .util.list import ensure_list
 from .util.textwrap import shorten_to_bytes_width
 
@@ -41,6 +42,7 @@ class RawFeedEntry(dict):
         return [c.strip() for c in ensure_list(self.get("category"))]
 
 
+@add_slots  # Many instances are created for each feed read.
 @dataclasses.dataclass(unsafe_hash=True)
 class FeedEntry:
     """Feed entry."""
@@ -51,38 +53,12 @@ class FeedEntry:
     categories: List[str] = dataclasses.field(compare=False, repr=True)
     data: Dict[str, Any] = dataclasses.field(compare=False, repr=False)
     feed_reader: Any = dataclasses.field(compare=False, repr=False)
+    short_url: Optional[str] = dataclasses.field(compare=False, repr=False, init=False)
+    matching_title_search_pattern: Optional[Pattern] = dataclasses.field(compare=False, repr=False, init=False)
 
     def __post_init__(self):
-        self.short_url: Optional[str] = None
-        self.matching_title_search_pattern: Optional[Pattern] = None
-
-    def _matching_pattern(self, patterns: Dict[str, List[Pattern]]) -> Optional[Tuple[str, Pattern]]:
-        """Return the matching key name and regular expression pattern, if any."""
-        # Check title and long URL
-        for search_key, val in {"title": self.title, "url": self.long_url}.items():
-            for pattern in patterns[search_key]:
-                if pattern.search(val):
-                    log.log(5, "%s matches %s pattern %s.", self, search_key, repr(pattern.pattern))
-                    return search_key, pattern
-
-        # Check categories
-        for pattern in patterns["category"]:
-            for category in self.categories:  # This loop is only for categories.
-                if pattern.search(category):
-                    log.log(5, "%s having category %s matches category pattern %s.", self, repr(category), repr(pattern.pattern))
-                    return "category", pattern
-
-        return None
-
-    @property
-    def blacklisted_pattern(self) -> Optional[Tuple[str, Pattern]]:
-        """Return the matching key name and blacklisted regular expression pattern, if any."""
-        return self._matching_pattern(self.feed_reader.blacklist)
-
-    @property
-    def whitelisted_pattern(self) -> Optional[Tuple[str, Pattern]]:
-        """Return the matching key name and whitelisted regular expression pattern, if any."""
-        return self._matching_pattern(self.feed_reader.whitelist)
+        self.short_url = None
+        self.matching_title_search_pattern = None
 
     @property
     def message(self) -> str:  # pylint: disable=too-many-locals
@@ -1,35 +1,43 @@
 """Feed reader and feed."""
 import collections
 import concurrent.futures
+import copy
 import dataclasses
+import hashlib
 import logging
 import multiprocessing as mp
 import multiprocessing.pool
 import re
+import threading
 import time
 import types
 from functools import cached_property, lru_cache
-from typing import Callable, Dict, List, Optional, Pattern, Tuple
+from typing import Dict, List, Optional, Pattern, Set, Tuple
 
 import bitlyshortener
 import miniirc
-from orderedset import OrderedSet
 
 from . import config
 from .db import Database
 from .entry import FeedEntry, RawFeedEntry
-from .url import URLReader
+from .url import URLContent, URLReader
 from .util.bs4 import html_to_text
 from .util.dict import dict_str
 from .util.list import ensure_list
+from .util.re import MultiPattern
 from .util.set import leaves
 from .util.str import readable_list
 from .util.textwrap import shorten_to_bytes_width
-from .util.time import Throttle
+from .util.time import TokenBucket
 from .util.timeit import Timer
+from .util.urllib import url_to_netloc
 
 log = logging.getLogger(__name__)
 
+_WORKER_POOL_LOCK = threading.Lock()  # Prevents concurrent feed readers from each creating a worker pool.
+_URL_READ_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=config.READ_URL_THREADS_MAX, thread_name_prefix="URLReader")
+_OUTGOING_MSG_BUCKET = TokenBucket(rate=1 / config.SECONDS_PER_MESSAGE, capacity=config.MESSAGES_BURST_MAX)  # Used for rate limiting across multiple channels.
+
 
 def _parse_entries(parser_name: str, selector: Optional[str], follower: Optional[str], url_content: bytes) -> Tuple[List[RawFeedEntry], List[str]]:
     from . import parsers  # pylint: disable=import-outside-toplevel
@@ -44,17 +52,38 @@ def _parse_entries(parser_name: str, selector: Optional[str], follower: Optional
 
 
 @lru_cache(maxsize=None)  # maxsize is bounded by a multiple of the number of feeds.
-def _patterns(channel: str, feed: str, list_type: str) -> Dict[str, List[Pattern]]:  # Cache-lookup friendly signature.
-    """Return a mapping of keys to a list of unique compiled regular expression patterns for the given args.
+def _patterns(channel: str, feed: str, list_type: str) -> Dict[str, MultiPattern]:  # Cache-lookup friendly signature.
+    """Return a mapping of keys to the unique compiled regular expression patterns for the given args.
 
     The mapping keys are `title`, `url`, and `category`.
     """
     list_config = config.INSTANCE["feeds"][channel][feed].get(list_type) or {}
-    patterns = {key: [re.compile(pat) for pat in leaves(list_config.get(key))] for key in ("title", "url", "category")}
+    patterns = {key: MultiPattern([re.compile(pat) for pat in leaves(list_config.get(key))]) for key in ("title", "url", "category")}
     log.debug("Caching regex patterns for %s of feed %s of %s.", list_type, feed, channel)
     return patterns
 
 
+def _matching_patterns(entries: List[FeedEntry], patterns: Dict[str, MultiPattern]) -> List[Optional[Tuple[str, Pattern]]]:
+    """Return a list of the matching key name and regular expression pattern, if any, for each of the given entries.
+
+    For each key, the texts of all as yet unmatched entries are searched in a single batch.
+    """
+    matches: List[Optional[Tuple[str, Pattern]]] = [None] * len(entries)
+    for search_key, entry_attr in {"title": "title", "url": "long_url", "category": "categories"}.items():
+        if not (key_patterns := patterns[search_key]):
+            continue
+        unmatched_entries = [(index, entry) for index, entry in enumerate(entries) if matches[index] is None]
+        if search_key == "category":
+            indexed_texts = [(index, category) for index, entry in unmatched_entries for category in entry.categories]
+        else:
+            indexed_texts = [(index, getattr(entry, entry_attr)) for index, entry in unmatched_entries]
+        for (index, text), pattern in zip(indexed_texts, key_patterns.search_many(text for _, text in indexed_texts)):
+            if pattern and (matches[index] is None):
+                log.log(5, "%s having %s %s matches %s pattern %s.", entries[index], search_key, repr(text), search_key, repr(pattern.pattern))
+                matches[index] = search_key, pattern
+    return matches
+
+
 @dataclasses.dataclass
 class FeedReader:
     """Initialize a feed reader of a given channel and feed."""
@@ -70,12 +99,19 @@ class FeedReader:
     def __post_init__(self):
         log.debug(f"Initializing {self}.")
         self.config: Dict = {**config.INSTANCE["defaults"], **config.INSTANCE["feeds"][self.channel][self.name]}
-        self.urls = OrderedSet(ensure_list(self.config["url"]))
+        self.urls = list(dict.fromkeys(ensure_list(self.config["url"])))
         self.min_channel_idle_time = config.MIN_CHANNEL_IDLE_TIME_DEFAULT if (self.config.get("period", config.PERIOD_HOURS_DEFAULT) > config.PERIOD_HOURS_MIN) else 0
         self.blacklist = _patterns(self.channel, self.name, "blacklist")
         self.whitelist = _patterns(self.channel, self.name, "whitelist")
         self.max_posts_if_new = config.NEW_FEED_POSTS_MAX[self.config["new"]]
 
+        # Configure transformations
+        # Note: Their regex patterns are compiled by the `subs` and `format_res` properties when the feed is first read.
+        format_config = self.config.get("format") or {}
+        self.is_formatted = bool(format_config)
+        format_str = format_config.get("str") or {}
+        self.title_format_str, self.url_format_str = format_str.get("title", "{title}"), format_str.get("url", "{url}")
+
         # Configure parser
         for parser_name in ("hext", "jmes", "jmespath", "pandas"):  # Searched in alphabetical order.
             if parser_config := self.config.get(parser_name):
@@ -91,18 +127,44 @@ class FeedReader:
             parser_name = "feedparser"
             parser_selector, parser_follower = None, None
         self.parser_name, self.parser_selector, self.parser_follower = parser_name, parser_selector, parser_follower
+        # Note: The raw entries are not retained, so as to not hold the memory of the parser results in this process.
+        self._url_parses: Dict[str, Tuple[bytes, int, List[str]]] = {}  # Maps URLs to content hashes, numbers of entries, and followable URLs.
+        self._processed_entries: Tuple[Tuple[Tuple[str, bytes], ...], List[FeedEntry]] = ((), [])  # URL content hashes and processed entries of the last read.
 
         log.debug(f"Initialized {self} having {len(self.urls)} configured URLs.")
 
     def __str__(self):
         return f"feed {self.name} reader of {self.channel}"
 
+    @cached_property
+    def format_res(self) -> Dict[str, Pattern]:
+        """Return a mapping of the format keys to their compiled regex patterns."""
+        # Note: This is compiled when reading the feed, so that an invalid pattern is alerted as a feed read failure.
+        format_config = self.config.get("format") or {}
+        return {key: re.compile(pattern) for key, pattern in (format_config.get("re") or {}).items()}
+
+    @cached_property
+    def subs(self) -> Dict[str, Tuple[Pattern, str]]:
+        """Return a mapping of the entry attribute names to their compiled substitution regex patterns and replacements."""
+        # Note: This is compiled when reading the feed, so that an invalid pattern is alerted as a feed read failure.
+        sub_config = self.config.get("sub") or {}
+        sub_attrs = {"title": "title", "url": "long_url", "summary": "summary"}
+        return {
+            entry_attr: (re.compile(sub_attr_config["pattern"]), sub_attr_config["repl"])
+            for sub_attr, entry_attr in sub_attrs.items()
+            if (sub_attr_config := sub_config.get(sub_attr))
+        }
+
     def _dedupe_entries(self, entries: List[FeedEntry], *, after_what: Optional[str] = None) -> List[FeedEntry]:
         """Remove duplicate entries while preserving order."""
         # e.g. for https://projecteuclid.org/feeds/euclid.ba_rss.xml
         action = f"After {after_what}, removing" if after_what else "Removing"
         log.debug("%s duplicate entry URLs for %s.", action, self)
-        entries_deduped = list(dict.fromkeys(entries))
+        # Note: Keying by the long URL avoids the generated FeedEntry.__hash__ and __eq__, with the hash of the str being cached by Python.
+        entries_by_url: Dict[str, FeedEntry] = {}
+        for entry in entries:
+            entries_by_url.setdefault(entry.long_url, entry)
+        entries_deduped = list(entries_by_url.values())
         num_removed = len(entries) - len(entries_deduped)
         action = f"After {after_what}, removed" if after_what else "Removed"
         log.debug("%s %s duplicate entry URLs out of %s, leaving %s, for %s.", action, num_removed, len(entries), len(entries_deduped), self)
@@ -120,7 +182,7 @@ class FeedReader:
         # Remove blacklisted entries
         if feed_config.get("blacklist", {}):
             log.debug("Filtering %s entries using blacklist for %s.", len(entries), self)
-            entries = [entry for entry in entries if not entry.blacklisted_pattern]
+            entries = [entry for entry, key_pattern_tuple in zip(entries, _matching_patterns(entries, self.blacklist)) if not key_pattern_tuple]
             log.debug("Filtered to %s entries using blacklist for %s.", len(entries), self)
             if not entries:
                 return entries
@@ -129,8 +191,8 @@ class FeedReader:
         if feed_config.get("whitelist", {}):
             log.debug("Filtering %s entries using whitelist for %s.", len(entries), self)
             whitelisted_entries: List[FeedEntry] = []
-            for entry in entries:
-                if key_pattern_tuple := entry.whitelisted_pattern:
+            for entry, key_pattern_tuple in zip(entries, _matching_patterns(entries, self.whitelist)):
+                if key_pattern_tuple:
                     key, pattern = key_pattern_tuple
                     if key == "title":
                         entry.matching_title_search_pattern = pattern
@@ -140,43 +202,39 @@ class FeedReader:
             if not entries:
                 return entries
 
-        # Enforce HTTPS for URLs
-        if feed_config.get("https"):
-            log.debug("Enforcing HTTPS for URLs in %s.", self)
-            for entry in entries:
-                if entry.long_url.startswith("http://"):
-                    entry.long_url = entry.long_url.replace("http://", "https://", 1)
-            log.debug("Enforced HTTPS for URLs in %s.", self)
-
-        # Remove WWW from URLs
-        if feed_config.get("www") is False:
-            log.debug("Removing WWW from URLs in %s.", self)
-            for entry in entries:
+        # Configure transformations
+        # Note: All transformations are applied in a single pass over the entries.
+        enforce_https = bool(feed_config.get("https"))
+        remove_www = feed_config.get("www") is False
+        subs = self.subs.items()
+        is_formatted, format_res = self.is_formatted, self.format_res.items()
+        title_format_str, url_format_str = self.title_format_str, self.url_format_str
+        feed_params = types.SimpleNamespace(url=feed_config["url"])
+        quote_begin, quote_end = tuple("“”")
+        title_max_bytes = config.TITLE_MAX_BYTES
+
+        # Transform entries
+        log.debug("Transforming %s entries for %s.", len(entries), self)
+        for entry in entries:
+            # Enforce HTTPS for URLs
+            if enforce_https and entry.long_url.startswith("http://"):
+                entry.long_url = entry.long_url.replace("http://", "https://", 1)
+
+            # Remove WWW from URLs
+            if remove_www:
                 for protocol in ("https", "http"):
                     prefix = f"{protocol}://www."
                     if entry.long_url.startswith(prefix):
                         entry.long_url = entry.long_url.replace(prefix, prefix[:-4], 1)
-            log.debug("Removed WWW from URLs in %s.", self)
-
-        # Substitute entries
-        if sub_config := feed_config.get("sub"):
-            log.debug("Substituting entries for %s.", self)
-            re_sub: Callable[[Dict[str, str], str], str] = lambda r, v: re.sub(r["pattern"], r["repl"], v)
-            for sub_attr, entry_attr in {"title": "title", "url": "long_url", "summary": "summary"}.items():
-                if sub_attr_config := sub_config.get(sub_attr):
-                    for entry in entries:
-                        if entry_attr_val_old := getattr(entry, entry_attr):
-                            entry_attr_val_new = re_sub(sub_attr_config, entry_attr_val_old)
-                            setattr(entry, entry_attr, entry_attr_val_new)
-            log.debug("Substituted entries for %s.", self)
-
-        # Format entries
-        if format_config := feed_config.get("format"):
-            log.debug("Formatting entries for %s.", self)
-            format_re = format_config.get("re") or {}
-            format_str = format_config.get("str") or {}
-            feed_params = types.SimpleNamespace(url=feed_config["url"])
-            for entry in entries:
+
+            # Substitute entries
+            for entry_attr, (sub_pattern, sub_repl) in subs:
+                if entry_attr_val_old := getattr(entry, entry_attr):
+                    entry_attr_val_new = sub_pattern.sub(sub_repl, entry_attr_val_old)
+                    setattr(entry, entry_attr, entry_attr_val_new)
+
+            # Format entries
+            if is_formatted:
                 # Collect:
                 params = {
                     **entry.data,
@@ -186,131 +244,173 @@ class FeedReader:
                     "categories": entry.categories,
                     "feed": feed_params,
                 }
-                for re_key, re_val in format_re.items():
-                    if match := re.search(re_val, params[re_key]):
+                for re_key, format_pattern in format_res:
+                    if match := format_pattern.search(params[re_key]):
                         params.update(match.groupdict())
                 # Format title:
-                title_format_str = format_str.get("title", "{title}")
                 try:
                     entry.title = title_format_str.format_map(params)
                 except Exception as exc:  # pylint: disable=broad-except
                     log.warning(f"Unable to format entry title for {entry} by {self} due to exception {exc!r} using format string {title_format_str!r}.")
                 # Format URL:
-                url_format_str = format_str.get("url", "{url}")
                 try:
                     entry.long_url = url_format_str.format_map(params)
                 except Exception as exc:  # pylint: disable=broad-except
                     log.warning(f"Unable to format entry URL for {entry} by {self} due to exception {exc!r} using format string {url_format_str!r}.")
-            log.debug("Formatted entries for %s.", self)
 
-        # Escape spaces in URLs
-        log.debug("Escaping spaces in URLs for %s.", self)
-        for entry in entries:
+            # Escape spaces in URLs
             # e.g. for https://covid-api.com/api/reports?iso=USA&region_province=New York&date=2020-03-15
-            entry.long_url = entry.long_url.strip().replace(" ", "%20")
-        log.debug("Escaped spaces in URLs for %s.", self)
+            long_url = entry.long_url.strip()
+            if " " in long_url:
+                long_url = long_url.replace(" ", "%20")
+            entry.long_url = long_url
 
-        # Strip HTML tags from titles and summaries
-        log.debug("Stripping HTML tags from titles and summaries for %s.", self)
-        for entry in entries:
+            # Strip HTML tags from titles and summaries
             # e.g. for http://rss.sciencedirect.com/publication/science/08999007  (Elsevier Nutrition journal)
             entry.title = html_to_text(entry.title)
             entry.summary = html_to_text(entry.summary)
-        log.debug("Stripped HTML tags from titles and summaries for %s.", self)
 
-        # Strip unicode quotes around titles
-        quote_begin, quote_end = tuple("“”")
-        # e.g. for https://www.sciencedirect.com/science/article/abs/pii/S0899900718307883
-        log.debug("Stripping unicode quotes around titles for %s.", self)
-        for entry in entries:
+            # Strip unicode quotes around titles
+            # e.g. for https://www.sciencedirect.com/science/article/abs/pii/S0899900718307883
             title = entry.title
             if (len(title) > 2) and (title[0] == quote_begin) and (title[-1] == quote_end):
-                title = title[1:-1]
-                if (quote_begin not in title) and (quote_end not in title):
-                    entry.title = title
-        log.debug("Stripped unicode quotes around titles for %s.", self)
+                if (title.find(quote_begin, 1, -1) == -1) and (title.find(quote_end, 1, -1) == -1):  # Avoids slicing unless stripping.
+                    entry.title = title[1:-1]
 
-        # Remove trailing periods from title
-        log.debug("Removing trailing periods from single-sentence titles for %s.", self)
-        for entry in entries:
-            if len(entry.title.rstrip().split(". ", maxsplit=1)) < 2:  # Crude check.
-                entry.title = entry.title.rstrip().rstrip(".")  # e.g. for PubMed RSS feeds
-        log.debug("Removed trailing periods from single-sentence titles for %s.", self)
+            # Remove trailing periods from single-sentence titles
+            title = entry.title.rstrip()
+            if ". " not in title:  # Crude check.
+                entry.title = title.rstrip(".")  # e.g. for PubMed RSS feeds
 
-        # Replace all-caps titles
-        log.debug("Capitalizing all-caps multi-word titles for %s.", self)
-        for entry in entries:
-            entry_has_multiple_words = len(entry.title.split(maxsplit=1)) > 1
-            if entry_has_multiple_words and entry.title.isupper():  # e.g. for https://redd.it/fm8z83
+            # Capitalize all-caps multi-word titles
+            if entry.title.isupper() and (len(entry.title.split(maxsplit=1)) > 1):  # e.g. for https://redd.it/fm8z83
                 entry.title = entry.title.capitalize()
-        log.debug("Capitalized all-caps multi-word titles for %s.", self)
 
-        # Shorten titles
-        title_max_bytes = config.TITLE_MAX_BYTES
-        log.debug("Shortening titles to %s bytes for %s.", title_max_bytes, self)
-        for entry in entries:
+            # Shorten titles
             entry.title = shorten_to_bytes_width(entry.title, title_max_bytes)
-        log.debug("Shortened titles to %s bytes for %s.", title_max_bytes, self)
+        log.debug("Transformed %s entries for %s.", len(entries), self)
 
         # Deduplicate entries
         entries = self._dedupe_entries(entries)
 
         return entries
 
-    def _parse_entries(self, url_content: bytes) -> Tuple[List[FeedEntry], List[str]]:
+    def _parse_entries(self, content: bytes) -> Tuple[List[RawFeedEntry], List[str]]:
         # Note: Using a separate temporary process is a workaround for memory leaks of hext, feedparser, etc.
         # with mp.Pool(1) as pool:
         log.debug(f"Using process worker from pool to parse entries for {self} using {self.parser_name}.")
-        raw_entries, urls = self.worker_pool.apply(_parse_entries, (self.parser_name, self.parser_selector, self.parser_follower, url_content))
+        raw_entries, urls = self.worker_pool.apply(_parse_entries, (self.parser_name, self.parser_selector, self.parser_follower, content))
         log.debug(f"Used process worker from pool to parse {len(raw_entries):,} raw entries and {len(urls):,} URLs for {self} using {self.parser_name}.")
-        entries = [FeedEntry(title=e.title, long_url=e.link, summary=e.summary, categories=e.categories, data=dict(e), feed_reader=self) for e in raw_entries]
-        log.debug(f"Converted {len(raw_entries):,} raw entries to actual entries for {self}.")
-        return entries, urls
+        return raw_entries, urls
+
+    def _read_urls(self, urls: List[str]) -> List[URLContent]:
+        """Return the contents of the given URLs.
+
+        URLs having different hosts are read concurrently, whereas URLs having the same host are read serially.
+        """
+
+        def read_serially(netloc_urls: List[str]) -> List[URLContent]:
+            url_contents: List[URLContent] = []
+            for url in netloc_urls:
+                if url_contents and url_contents[-1].is_cache_miss:
+                    log.debug(f"Sleeping for {config.SECONDS_BETWEEN_FEED_URLS}s before next URL {url}.")
+                    time.sleep(config.SECONDS_BETWEEN_FEED_URLS)
+                url_contents.append(self.url_reader[url])
+            return url_contents
+
+        if len(urls) == 1:  # Common case which requires no grouping by host.
+            return read_serially(urls)
+        netlocs_urls: Dict[str, List[str]] = {}
+        for url in urls:
+            netlocs_urls.setdefault(url_to_netloc(url), []).append(url)
+        if len(netlocs_urls) == 1:
+            netlocs_url_contents = [read_serially(urls)]
+        else:
+            log.debug(f"Reading {len(urls)} URLs having {len(netlocs_urls)} hosts concurrently for {self}.")
+            netlocs_url_contents = list(_URL_READ_EXECUTOR.map(read_serially, netlocs_urls.values()))
+        urls_contents = {url: url_content for netloc_urls, url_contents in zip(netlocs_urls.values(), netlocs_url_contents) for url, url_content in zip(netloc_urls, url_contents)}
+        return [urls_contents[url] for url in urls]
+
+    def _parse_or_defer_url_content(self, url: str, content: bytes, content_hash: bytes) -> Tuple[Optional[List[RawFeedEntry]], int, List[str]]:
+        """Return the parsed entries, the number of entries, and the followable URLs for the given content of the given URL.
+
+        If the content is unchanged since the last read, its parsing is deferred, and None is returned instead of its entries.
+        """
+        if (url_parse := self._url_parses.get(url)) and (url_parse[0] == content_hash):
+            selected_entries = None
+            _, num_entries, follow_urls = url_parse
+            log_msg = f"Deferred parsing {num_entries:,} entries and reused {len(follow_urls):,} followable URLs for unchanged {url} for {self}."
+        else:
+            log.debug(f"Parsing entries for {url} for {self} using {self.parser_name}.")
+            selected_entries, follow_urls = self._parse_entries(content)
+            num_entries = len(selected_entries)
+            log_msg = f"Parsed {num_entries:,} entries and {len(follow_urls):,} followable URLs for {url} for {self} using {self.parser_name}."
+
+        # Raise alert if no entries for URL
+        if num_entries:
+            log.debug(log_msg)
+        else:
+            if self.config.get("alerts", {}).get("empty", True):
+                log_msg += " Either check the feed configuration, or wait for its next read, or set `alerts.empty` to `false` for it."
+                config.runtime.alert(log_msg)
+            else:
+                log.warning(log_msg)
+        return selected_entries, num_entries, follow_urls
 
     def read(self) -> "Feed":  # pylint: disable=too-many-locals
         """Read feed with entries."""
         timer = Timer()
-        feed_config = self.config
 
         # Retrieve URL content and parse entries
-        urls_pending, urls_read = self.urls.copy(), OrderedSet()
+        # Note: The parsing of a URL having unchanged content is deferred, as it is needed only if the content of another URL has changed.
+        urls_pending: Dict[str, None] = dict.fromkeys(self.urls)  # Used as an ordered set.
+        urls_read: Set[str] = set()
         url_read_approach_counts: collections.Counter = collections.Counter()
-        entries = []
+        url_content_hashes: List[Tuple[str, bytes]] = []
+        url_parses: Dict[str, Tuple[bytes, int, List[str]]] = {}
+        urls_raw_entries: Dict[str, List[RawFeedEntry]] = {}
+        unparsed_url_contents: Dict[str, bytes] = {}
         while urls_pending:
-            # Read URL
-            url = urls_pending.pop(last=False)
-            url_content = self.url_reader[url]
-            url_read_finish_time = time.monotonic()
-            urls_read.add(url)
-            url_read_approach_counts.update([url_content.approach])
-            # Parse content
-            log.debug(f"Parsing entries for {url} for {self} using {self.parser_name}.")
-            selected_entries, follow_urls = self._parse_entries(url_content.content)
-            log_msg = f"Parsed {len(selected_entries):,} entries and {len(follow_urls):,} followable URLs for {url} for {self} using {self.parser_name}."
-            entries.extend(selected_entries)
-            urls_pending.update(follow_urls - urls_read)
-
-            # Raise alert if no entries for URL
-            if selected_entries:
-                log.debug(log_msg)
-            else:
-                if feed_config.get("alerts", {}).get("empty", True):
-                    log_msg += " Either check the feed configuration, or wait for its next read, or set `alerts.empty` to `false` for it."
-                    config.runtime.alert(log_msg)
+            # Read URLs
+            urls = list(urls_pending)
+            urls_pending = {}
+            url_contents = self._read_urls(urls)
+            urls_read.update(urls)
+            for url, url_content in zip(urls, url_contents):
+                url_read_approach_counts.update([url_content.approach])
+                content = url_content.content
+                content_hash = hashlib.blake2b(content, digest_size=16).digest()
+                url_content_hashes.append((url, content_hash))
+                selected_entries, num_entries, follow_urls = self._parse_or_defer_url_content(url, content, content_hash)
+                if selected_entries is None:
+                    unparsed_url_contents[url] = content
                 else:
-                    log.warning(log_msg)
+                    urls_raw_entries[url] = selected_entries
+                url_parses[url] = content_hash, num_entries, follow_urls
+                urls_pending.update(dict.fromkeys(follow_url for follow_url in follow_urls if follow_url not in urls_read))
 
-            # Sleep between URLs
-            if urls_pending and url_content.is_cache_miss:
-                time_elapsed_since_url_read = time.monotonic() - url_read_finish_time
-                sleep_time = max(0, config.SECONDS_BETWEEN_FEED_URLS - time_elapsed_since_url_read)
-                if sleep_time > 0:
-                    log.debug(f"Sleeping for {sleep_time:.1f}s before next URL.")
-                    time.sleep(sleep_time)
+        self._url_parses = dict(list(url_parses.items())[: config.CACHE_MAXSIZE__FEED_URL_PARSES])  # Forgets URLs no longer being read.
 
         url_read_approach_desc = readable_list([f"{count} URLs {approach}" for approach, count in url_read_approach_counts.items()])
-        log.debug(f"Read {len(entries)} entries via {url_read_approach_desc} for {self} using {self.parser_name} parser in {timer}.")
-        entries = self._process_entries(entries)
+        log.debug(f"Read {len(url_content_hashes)} URLs via {url_read_approach_desc} for {self} using {self.parser_name} parser in {timer}.")
+
+        # Process entries unless the content of all URLs is unchanged since the last read
+        # Note: Retaining the processed entries trades memory for the CPU time of parsing and processing unchanged feeds.
+        # The retained entries are those of the latest feed, so that the URLs shortened for it are reused.
+        # Copies of them are used for the next feed, so that the entries of a feed are not shared with those of another.
+        url_content_hashes_key = tuple(url_content_hashes)
+        if url_content_hashes_key == self._processed_entries[0]:
+            entries = [copy.copy(entry) for entry in self._processed_entries[1]]
+            log.debug(f"Reusing {len(entries)} entries processed previously for the unchanged content of all URLs for {self}.")
+        else:
+            for url, content in unparsed_url_contents.items():
+                log.debug(f"Parsing entries for unchanged {url} for {self} using {self.parser_name} as the content of another URL has changed.")
+                urls_raw_entries[url] = self._parse_entries(content)[0]
+            raw_entries = [raw_entry for url, _ in url_content_hashes for raw_entry in urls_raw_entries[url]]
+            entries = [FeedEntry(title=e.title, long_url=e.link, summary=e.summary, categories=e.categories, data=dict(e), feed_reader=self) for e in raw_entries]
+            log.debug(f"Converted {len(raw_entries):,} raw entries to actual entries for {self}.")
+            entries = self._process_entries(entries)
+        self._processed_entries = url_content_hashes_key, entries.copy()
         log.debug(f"Returning {len(entries)} processed entries via {url_read_approach_desc} for {self} having used {self.parser_name} parser in {timer}.")
         return Feed(entries=entries, reader=self, read_approach=url_read_approach_desc, read_time_used=timer())
 
@@ -320,13 +420,17 @@ class FeedReader:
         try:
             return self._worker_pool  # type: ignore
         except AttributeError:
-            processes = min(16, mp.cpu_count() * 2)
-            maxtasksperchild = 8
-            log.info(f"Creating the {self.__class__.__name__} worker pool with {processes} processes and {maxtasksperchild} tasks per child.")
-            # pylint: disable=protected-access
-            self.__class__._worker_pool = mp.Pool(processes=processes, maxtasksperchild=maxtasksperchild)  # type: ignore
-            return self.__class__._worker_pool  # type: ignore
-            # pylint: enable=protected-access
+            with _WORKER_POOL_LOCK:
+                try:
+                    return self._worker_pool  # type: ignore
+                except AttributeError:
+                    processes = min(16, mp.cpu_count() * 2)
+                    maxtasksperchild = 8
+                    log.info(f"Creating the {self.__class__.__name__} worker pool with {processes} processes and {maxtasksperchild} tasks per child.")
+                    # pylint: disable=protected-access
+                    self.__class__._worker_pool = mp.Pool(processes=processes, maxtasksperchild=maxtasksperchild)  # type: ignore
+                    return self.__class__._worker_pool  # type: ignore
+                    # pylint: enable=protected-access
 
 
 @dataclasses.dataclass
@@ -342,7 +446,7 @@ class Feed:
         return f"feed {self.name} of {self.channel}"
 
     @cached_property
-    def _postable_entries(self) -> List[FeedEntry]:
+    def postable_entries(self) -> List[FeedEntry]:
         """Return the subset of postable entries."""
         log.debug(f"Retrieving postable entries for {self}.")
         unposted_entries = self._unposted_entries
@@ -356,35 +460,40 @@ class Feed:
         else:
             postable_entries = unposted_entries
 
-        # Shorten URLs
-        if postable_entries and self.reader.config["shorten"]:
-            log.debug(f"Shortening {len(postable_entries)} postable long URLs for {self}.")
-            long_urls = [entry.long_url for entry in postable_entries]
-            short_urls = self.reader.url_shortener.shorten_urls(long_urls)
-            for entry, short_url in zip(postable_entries, short_urls):
-                entry.short_url = short_url
-            log.debug(f"Shortened {len(postable_entries)} postable long URLs for {self}.")
-
+        # Note: URLs are shortened separately by the channel messenger in a batch for all of its dequeued feeds.
         log.debug(f"Returning {len(postable_entries)} postable entries for {self}.")
         return postable_entries
 
+    @staticmethod
+    def _select_unposted_entries(feeds: List["Feed"]) -> List[List[FeedEntry]]:
+        """Return the subset of unposted entries for each of the given feeds of a single channel.
+
+        The unposted entries of each feed are treated as posted for the subsequent feeds, as the feeds are to be posted in order.
+        """
+        channel = feeds[0].channel
+        assert all(feed.channel == channel for feed in feeds)
+        log.debug(f"Retrieving unposted entries for {readable_list(feeds)}.")
+        feeds_entries_by_url = [{entry.long_url: entry for entry in feed.entries} for feed in feeds]  # Entries are already deduplicated by URL.
+        requests = [
+            (feed.name, feed.reader.config.get("dedup") or config.DEDUP_STRATEGY_DEFAULT, list(entries_by_url)) for feed, entries_by_url in zip(feeds, feeds_entries_by_url)
+        ]
+        feeds_unposted_entries = []
+        for feed, entries_by_url, unposted_long_urls in zip(feeds, feeds_entries_by_url, feeds[0].reader.db.select_unposted(channel, requests)):
+            unposted_entries = [entries_by_url[long_url] for long_url in unposted_long_urls]  # The order of the entries is preserved.
+            log.debug(f"Returning {len(unposted_entries)} unposted entries out of {len(entries_by_url)} for {feed}.")
+            feeds_unposted_entries.append(unposted_entries)
+        return feeds_unposted_entries
+
     @cached_property
     def _unposted_entries(self) -> List[FeedEntry]:
         """Return the subset of unposted entries."""
-        log.debug(f"Retrieving unposted entries for {self}.")
-        entries = self.entries
+        return self._select_unposted_entries([self])[0]
 
-        long_urls = [entry.long_url for entry in entries]
-        db_dedup_strategy = self.reader.config.get("dedup") or config.DEDUP_STRATEGY_DEFAULT
-        if db_dedup_strategy == "channel":
-            unposted_long_urls = self.reader.db.select_unposted_for_channel(self.channel, self.name, long_urls)
-        else:
-            assert db_dedup_strategy == "feed"
-            unposted_long_urls = self.reader.db.select_unposted_for_channel_feed(self.channel, self.name, long_urls)
-        unique_unposted_long_urls = set(unposted_long_urls)
-        unposted_entries = [entry for entry in entries if entry.long_url in unique_unposted_long_urls]
-        log.debug(f"Returning {len(unposted_entries)} unposted entries out of {len(entries)} for {self}.")
-        return unposted_entries
+    @classmethod
+    def prefetch_unposted_entries(cls, feeds: List["Feed"]) -> None:
+        """Cache the unposted entries of the given feeds of a single channel, retrieving them from the database together."""
+        for feed, unposted_entries in zip(feeds, cls._select_unposted_entries(feeds)):
+            feed._unposted_entries = unposted_entries  # Overrides the cached property.  # pylint: disable=protected-access
 
     @cached_property
     def channel(self) -> str:
@@ -399,7 +508,7 @@ class Feed:
     @cached_property
     def is_postable(self) -> bool:
         """Return whether the feed is postable."""
-        return len(self._postable_entries) > 0
+        return len(self.postable_entries) > 0
 
     def mark_posted(self) -> None:
         """Mark unposted entries as posted.
@@ -413,26 +522,25 @@ class Feed:
         """Post the postable entries and also update the channel topic as relevant."""
         irc = self.reader.irc
         channel = self.channel
-        seconds_per_msg = config.SECONDS_PER_MESSAGE
+        outgoing_msg_bucket = _OUTGOING_MSG_BUCKET
         channel_topics = config.runtime.channel_topics
-        postable_entries = self._postable_entries
+        postable_entries = self.postable_entries
         log.info(f"Posting {len(postable_entries)} entries for {self}.")
 
         # Post postable entries
         for entry in postable_entries:
             # Send message
-            with Throttle(seconds_per_msg):
-                msg = entry.message
-                irc.msg(channel, msg)
-                log.debug("Sent message to %s: %s", channel, msg)
+            msg = entry.message
+            outgoing_msg_bucket.acquire()
+            irc.msg(channel, msg)
+            log.debug("Sent message to %s: %s", channel, msg)
 
             # Update topic if changed
-            with Throttle(seconds_per_msg) as throttle:
-                old_topic = channel_topics.get(channel, "")
-                new_topic = entry.topic(old_topic)
-                if old_topic == new_topic:
-                    raise throttle.Break()
+            old_topic = channel_topics.get(channel, "")
+            new_topic = entry.topic(old_topic)
+            if old_topic != new_topic:
                 channel_topics[channel] = new_topic
+                outgoing_msg_bucket.acquire()
                 irc.quote("TOPIC", channel, f":{new_topic}")
                 log.info(f"Updated {channel} topic: {new_topic}")
 
@@ -442,7 +550,7 @@ class Feed:
         """Publish the posted entries as relevant."""
         publishers = self.reader.publishers
         num_publishers = len(publishers)
-        postable_entries = self._postable_entries
+        postable_entries = self.postable_entries
 
         def _publish(publisher) -> None:  # type: ignore
             timer = Timer()
@@ -81,7 +81,7 @@ def load_instance_config(log_details: bool = True) -> None:  # pylint: disable=t
     # Process instance config
     instance_config["dir"] = instance_config_path.parent
     instance_config["nick:casefold"] = instance_config["nick"].casefold()
-    instance_config["channels:casefold"] = [channel.casefold() for channel in instance_config["feeds"]]
+    instance_config["channels:casefold"] = frozenset(channel.casefold() for channel in instance_config["feeds"])  # Used for membership tests of every incoming message.
     # instance_config["repeated_urls"] = {url for url, count in url_counter.items() if count > 1}
 
     instance_config["defaults"] = {k: instance_config.get("defaults", {}).get(k, v) for k, v in config.FEED_DEFAULTS.items()}
@@ -1,12 +1,15 @@
 """Base searcher class with helper attributes and methods for searchers."""
 import abc
+import functools
+import io
 import logging
 import multiprocessing
 import multiprocessing.pool
 import os
-from typing import List, Optional, TypedDict
+import threading
+from typing import Dict, List, Optional, Tuple, TypedDict
 
-import cachetools.func
+import cachetools
 import github
 import ircstyle
 import pandas as pd
@@ -15,6 +18,25 @@ from .. import config
 
 log = logging.getLogger(__name__)
 
+# Note: These are module-level instead of instance attributes because the searcher instance is pickled for its worker pool.
+_SEARCH_CACHE: cachetools.TTLCache = cachetools.TTLCache(maxsize=config.SEARCH_CACHE_MAXSIZE, ttl=config.SEARCH_CACHE_TTL)  # Keys are (searcher name, query).
+_SEARCH_CACHE_LOCK = threading.Lock()  # Held during a search so that an identical concurrent search uses its cached response.
+_SEARCH_CACHE_STATS: Dict[str, int] = {"hits": 0, "misses": 0}
+
+
+@functools.lru_cache(maxsize=1)
+def _github_client() -> github.Github:
+    """Return the GitHub client which is shared by all searchers."""
+    # Note: The client's requester persists its connection, thereby reusing it with HTTP keep-alive across the paginated requests of a search.
+    # Requests of a search are sequential, and so a larger connection pool is not needed.
+    return github.Github(os.environ["GITHUB_TOKEN"].strip(), per_page=100)  # The max per_page reduces the number of requests for paginated results.
+
+
+@functools.lru_cache(maxsize=1)
+def _github_user() -> github.AuthenticatedUser.AuthenticatedUser:
+    """Return the GitHub user which is shared by all searchers."""
+    return _github_client().get_user()
+
 
 class SearchResults(TypedDict):
     """Dictionary of search results as returned by a searcher."""
@@ -28,8 +50,9 @@ class BaseSearcher(abc.ABC):
 
     def __init__(self, name: str):
         self.name = name
-        self._github = github.Github(os.environ["GITHUB_TOKEN"].strip())
-        self._github_user = self._github.get_user()
+        self._styled_name = ircstyle.style(name, italics=True, reset=True)
+        self._github = _github_client()
+        self._github_user = _github_user()
         log.info(f"Initalizing {self.name} searcher.")
 
     def __str__(self) -> str:
@@ -37,9 +60,11 @@ class BaseSearcher(abc.ABC):
 
     @staticmethod
     def _concat_results_dfs(dfs: List[pd.DataFrame]) -> None:
-        df = pd.concat(dfs)
+        df = dfs[0] if (len(dfs) == 1) else pd.concat(dfs, ignore_index=True)  # A single dataframe is not copied.
         dfs.clear()
-        df.sort_values(by=["datetime"], ascending=False, inplace=True, ignore_index=True)
+        for column in ("channel", "feed"):  # These have few distinct values, and so their categorical codes are faster to deduplicate.
+            df[column] = df[column].astype("category")
+        df.sort_values(by=["datetime"], ascending=False, inplace=True, kind="stable", ignore_index=True)  # Stable sort keeps the dedup deterministic.
         df.drop_duplicates(subset=["channel", "feed", "long_url"], inplace=True, ignore_index=True)
         dfs.append(df)
         assert len(dfs) == 1
@@ -60,7 +85,7 @@ class BaseSearcher(abc.ABC):
 
     def _search_inner(self, query: str) -> str:
         log.debug(f"Searching {self.name} for {query!r}.")
-        styled_name = ircstyle.style(self.name, italics=True, reset=True)
+        styled_name = self._styled_name
         response = self._search(query)
         df = response["results"]
         if df is None:  # Note: Explicit check prevents: ValueError: The truth value of a DataFrame is ambiguous
@@ -68,17 +93,24 @@ class BaseSearcher(abc.ABC):
             response_ = f"0 {styled_name} search results for {styled_query}. For help, see {self._syntax_help}"
             return response_
 
-        markdown_df = df.copy()
-        markdown_df.insert(0, "date_utc", markdown_df["datetime"].dt.date)
-        markdown_df["title"] = "[" + markdown_df["title"].str.replace("|", r"\|") + "](" + markdown_df["long_url"] + ")"
-        markdown_df.drop(columns=["datetime", "long_url", "short_url"], inplace=True)
+        markdown_df = pd.DataFrame(  # Only the required columns are used, without copying the others.
+            {
+                "date_utc": df["datetime"].dt.date,
+                "channel": df["channel"],
+                "feed": df["feed"],
+                "title": "[" + df["title"].str.replace("|", r"\|", regex=False) + "](" + df["long_url"] + ")",
+            }
+        )
+
+        csv_buffer = io.StringIO()
+        df.to_csv(csv_buffer, index=False)
 
         truncation_indicator = "max" if response["truncated"] else "all"
         gist = self._github_user.create_gist(
             public=False,
             files={
                 "results.md": github.InputFileContent(markdown_df.to_markdown(index=False, tablefmt="github")),
-                "results.csv": github.InputFileContent(df.to_csv(index=False)),
+                "results.csv": github.InputFileContent(csv_buffer.getvalue()),
             },
             description=f"{query}: {truncation_indicator} {len(df)} search results from {self.name}",
         )
@@ -87,10 +119,22 @@ class BaseSearcher(abc.ABC):
         response = f"{truncation_indicator.capitalize()} {len(df)} search results → {gist.html_url}#file-results-md (from {styled_name} for {styled_query})"
         return response
 
-    @cachetools.func.ttl_cache(maxsize=config.SEARCH_CACHE_MAXSIZE, ttl=config.SEARCH_CACHE_TTL)  # type: ignore
     def search(self, query: str) -> str:
-        """Return a summary containing a Gist link to the search results for the given query."""
-        return self.worker_pool.apply(self._search_inner, (query,))  # To prevent accumulation of potential memory leaks.
+        """Return a summary containing a Gist link to the search results for the given query.
+
+        The summary is cached for the given query.
+        """
+        key: Tuple[str, str] = (self.name, query)
+        with _SEARCH_CACHE_LOCK:
+            if (response := _SEARCH_CACHE.get(key)) is None:
+                _SEARCH_CACHE_STATS["misses"] += 1
+                response = self.worker_pool.apply(self._search_inner, (query,))  # To prevent accumulation of potential memory leaks.
+                _SEARCH_CACHE[key] = response
+            else:
+                _SEARCH_CACHE_STATS["hits"] += 1
+            hits, misses = _SEARCH_CACHE_STATS["hits"], _SEARCH_CACHE_STATS["misses"]
+            log.debug(f"Search cache has {len(_SEARCH_CACHE)} responses, {hits} hits, and {misses} misses, with a hit ratio of {hits / (hits + misses):.0%}.")
+        return response
 
     @property
     def worker_pool(self) -> multiprocessing.pool.Pool:
@@ -1,8 +1,9 @@
 """Search entries from GitHub."""
+import csv
 import datetime
-import io
 import logging
 from pathlib import Path
+from typing import Any, Dict, List
 
 import pandas as pd
 
@@ -12,6 +13,9 @@ from ._base import BaseSearcher, SearchResults
 
 log = logging.getLogger(__name__)
 
+_CSV_COLUMNS = ["feed", "title", "long_url", "short_url"]
+_CSV_HEADER = ",".join(_CSV_COLUMNS)
+_CSV_HEADER_LINE_BYTES = f"{_CSV_HEADER}\n".encode()
 _MAX_RESULTS = 500
 
 
@@ -26,44 +30,85 @@ class Searcher(BaseSearcher):
     def _syntax_help(self) -> str:
         return "https://j.mp/gh-search-syntax and https://j.mp/gh-search-code"
 
+    @staticmethod
+    def _results_df(columns: Dict[str, List[Any]]) -> pd.DataFrame:
+        """Return a dataframe of the given columns of results, with empty strings as missing values as with `pd.read_csv`."""
+        data = {"datetime": pd.to_datetime(columns["datetime"], utc=True)}
+        for column in ("channel", *_CSV_COLUMNS):
+            data[column] = pd.array([(value or None) for value in columns[column]], dtype="string")
+        return pd.DataFrame(data)
+
+    @staticmethod
+    def _result_rows(content: bytes, text_matches: List[Dict[str, Any]]) -> List[List[str]]:
+        """Return the parsed CSV rows of the lines having the given text matches in the given content of a result."""
+        rows: List[List[str]] = []
+        for text_match in text_matches:
+            fragment = text_match["fragment"]
+            is_fragment_ascii = fragment.isascii()
+            fragment_index_in_content = content.find(fragment.encode())
+            assert fragment_index_in_content != -1
+            for match in text_match["matches"]:
+                match_start_index_in_fragment, match_end_index_in_fragment = match["indices"]  # Expected to always use only a single line.
+                if not is_fragment_ascii:  # The indices are of characters, and are converted to be of bytes.
+                    match_start_index_in_fragment = len(fragment[:match_start_index_in_fragment].encode())
+                    match_end_index_in_fragment = len(fragment[:match_end_index_in_fragment].encode())
+                # Note: The bounded searches scan only the line of the match, without copying the content before or after it.
+                line_start_index = content.rfind(b"\n", 0, fragment_index_in_content + match_start_index_in_fragment) + 1
+                if line_start_index < len(_CSV_HEADER_LINE_BYTES):  # The match is in the header line.
+                    continue
+                if (line_end_index := content.find(b"\n", fragment_index_in_content + match_end_index_in_fragment)) == -1:
+                    line_end_index = len(content)
+                line_csv = content[line_start_index:line_end_index].decode()
+                rows.append(next(csv.reader([line_csv])))
+        return rows
+
     def _search(self, query: str) -> SearchResults:  # pylint: disable=too-many-locals
         # Docs:
         # https://pygithub.readthedocs.io/en/latest/github.html#github.MainClass.Github.search_code
         # https://docs.github.com/en/rest/reference/search#search-code
         # https://docs.github.com/en/github/searching-for-information-on-github/understanding-the-search-syntax
         # https://docs.github.com/en/github/searching-for-information-on-github/searching-code#considerations-for-code-search
-        dfs = []
+        dfs: List[pd.DataFrame] = []
+        columns: Dict[str, List[Any]] = {column: [] for column in ("datetime", "channel", *_CSV_COLUMNS)}  # Collected by column for building a single dataframe.
         num_results = 0
         validator = SqliteFTS5Matcher(query)
+        validations: Dict[str, bool] = {}  # Maps searchable texts to whether they match, as the same entry can be matched in multiple results.
         paginated_results = self._github.search_code(query, sort="indexed", highlight=True, repo=self._repo)  # highlight=True returns text_matches.
         for result in paginated_results:
-            content = result.decoded_content.decode()
-            assert content.startswith("feed,title,long_url,short_url\n")
-            path = Path(result.path)
-            for text_match in result.text_matches:
-                fragment = text_match["fragment"]
-                fragment_index_in_content = content.find(fragment)
-                assert fragment_index_in_content != -1
-                for match in text_match["matches"]:
-                    match_indices_in_fragment = match["indices"]
-                    match_indices_in_content = [fragment_index_in_content + i for i in match_indices_in_fragment]  # Expected to always use only a single line.
-                    line_indices_in_content = [content[: match_indices_in_content[0]].rfind("\n"), match_indices_in_content[1] + content[match_indices_in_content[1] :].find("\n")]
-                    line_csv = content[: content.find("\n")] + content[slice(*line_indices_in_content)]
-                    df = pd.read_csv(io.StringIO(line_csv), dtype="string")
-                    searchable_full_text = " ".join(df.at[0, c] for c in ("feed", "title", "long_url"))
-                    if not validator.is_match(searchable_full_text):
-                        continue
-                    df.insert(0, "channel", path.parts[0])
-                    df.insert(0, "datetime", datetime.datetime.strptime(str(Path(*path.parts[1:])) + " +0000", "%Y/%m%d/%H%M%S.csv %z"))
-                    dfs.append(df)
-                    num_results += 1
+            content = result.decoded_content  # Note: This is not decoded as only the lines of the matches are decoded.
+            assert content.startswith(_CSV_HEADER_LINE_BYTES)
+            channel, date_year, date_month_day, time_csv = Path(result.path).parts  # Example: #some-channel/2020/0102/030405.csv
+            time_ = time_csv[:-4]  # Note: Slicing avoids the much slower datetime.strptime.
+            result_datetime = datetime.datetime(
+                int(date_year), int(date_month_day[:2]), int(date_month_day[2:]), int(time_[:2]), int(time_[2:4]), int(time_[4:]), tzinfo=datetime.timezone.utc
+            )
+            result_rows = self._result_rows(content, result.text_matches)  # Validated together after collection.
+
+            searchable_full_texts = [f"{feed} {title} {long_url}" for feed, title, long_url, _short_url in result_rows]
+            if unvalidated_texts := list(dict.fromkeys(text for text in searchable_full_texts if text not in validations)):
+                validations.update(zip(unvalidated_texts, validator.are_matches(unvalidated_texts)))
+            for (feed, title, long_url, short_url), searchable_full_text in zip(result_rows, searchable_full_texts):
+                if not validations[searchable_full_text]:
+                    continue
+                columns["datetime"].append(result_datetime)
+                columns["channel"].append(channel)
+                columns["feed"].append(feed)
+                columns["title"].append(title)
+                columns["long_url"].append(long_url)
+                columns["short_url"].append(short_url)
+                num_results += 1
+                if num_results == _MAX_RESULTS:
+                    dfs.append(self._results_df(columns))
+                    for values in columns.values():
+                        values.clear()
+                    self._concat_results_dfs(dfs)
+                    df = dfs[0]
+                    num_results = len(df)  # Note: num_results must not be removed as it is also used in other lines.
                     if num_results == _MAX_RESULTS:
-                        self._concat_results_dfs(dfs)
-                        df = dfs[0]
-                        num_results = len(df)  # Note: num_results must not be removed as it is also used in other lines.
-                        if num_results == _MAX_RESULTS:
-                            return {"results": df, "truncated": True}
+                        return {"results": df, "truncated": True}
 
+        if columns["datetime"]:
+            dfs.append(self._results_df(columns))
         if dfs:
             self._concat_results_dfs(dfs)
             return {"results": dfs[0], "truncated": False}
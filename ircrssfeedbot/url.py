@@ -33,20 +33,22 @@ def _decompress(content: bytes) -> bytes:
 class URLContent:
     """URL content."""
 
-    CURRENT_VERSION = 1
+    CURRENT_VERSION = 2
 
     class Approach:
         """Approaches for providing the content of a URL."""
 
         CACHE_HIT = "read from unexpired cache"
         CACHE_ETAG_HIT = "read from cache having matching etag"
+        CACHE_LAST_MODIFIED_HIT = "read from cache having unchanged last-modified time"
         READ = "read bypassing cache"
 
-    def __init__(self, content: bytes, etag: Optional[str], approach: str):
+    def __init__(self, content: bytes, etag: Optional[str], last_modified: Optional[str], approach: str):
         self.time = time.time()
         self.version = self.CURRENT_VERSION
         self._content = _compress(content)
         self.etag = etag
+        self.last_modified = last_modified
         self.approach = approach
 
     @property
@@ -164,6 +166,9 @@ class URLReader:
             elif is_etag_cache_allowed:
                 request_headers["If-None-Match"] = cached_url_content.etag
                 log.debug(f"Added request header If-None-Match={request_headers['If-None-Match']} for {url}.")
+        if cached_url_content and cached_url_content.last_modified and is_etag_cache_allowed and not test_cached_etag:
+            request_headers["If-Modified-Since"] = cached_url_content.last_modified
+            log.debug(f"Added request header If-Modified-Since={request_headers['If-Modified-Since']} for {url}.")
 
         # Request URL
         log.debug(f"Resiliently retrieving content for {url} using user agent {request_headers['User-Agent']!r}.")
@@ -186,16 +191,22 @@ class URLReader:
         # Reuse ETag cache if possible
         if response.status_code == 304:  # pylint: disable=too-many-nested-blocks
             # Note: 304 = Not Modified.
-            assert all((cached_url_content, has_cached_etag, not test_cached_etag, request_headers["If-None-Match"]))
+            is_etag_hit = "If-None-Match" in request_headers
+            assert cached_url_content and not test_cached_etag and (is_etag_hit or ("If-Modified-Since" in request_headers))
             url_content = URLContent(  # Sets updated time attribute too.
-                content=cached_url_content.content, etag=cached_url_content.etag, approach=URLContent.Approach.CACHE_ETAG_HIT
+                content=cached_url_content.content,
+                etag=cached_url_content.etag,
+                last_modified=response.headers.get("Last-Modified") or cached_url_content.last_modified,
+                approach=URLContent.Approach.CACHE_ETAG_HIT if is_etag_hit else URLContent.Approach.CACHE_LAST_MODIFIED_HIT,
             )
-            log.debug(f"Returning unchanged ETag matched URL content from cache for {url}.")
+            log.debug(f"Returning unchanged {'ETag' if is_etag_hit else 'Last-Modified'} matched URL content from cache for {url}.")
             self._CACHE[url] = url_content
             return url_content
 
         # Cache content
-        url_content = URLContent(content=response.content, etag=response.headers.get("ETag"), approach=URLContent.Approach.READ)
+        url_content = URLContent(
+            content=response.content, etag=response.headers.get("ETag"), last_modified=response.headers.get("Last-Modified"), approach=URLContent.Approach.READ
+        )
         self._CACHE[url] = url_content
         log.debug(f"Cached URL content of size {humanize_size(url_content.content)} for {url}.")
 
@@ -0,0 +1,53 @@
+"""asyncio utilities."""
+import asyncio
+import unittest
+
+
+class Barrier:
+    """Reusable barrier for coroutines running in a single event loop, similar to `threading.Barrier`."""
+
+    # Note: asyncio.Barrier is available only in Python>=3.11.
+
+    def __init__(self, parties: int):
+        self.parties = parties
+        self._num_waiting = 0
+        self._event = asyncio.Event()
+
+    @property
+    def n_waiting(self) -> int:
+        """Return the number of coroutines currently waiting at the barrier."""
+        return self._num_waiting
+
+    async def wait(self) -> None:
+        """Wait until all parties have called `wait`, following which the barrier is reset."""
+        event = self._event
+        self._num_waiting += 1
+        if self._num_waiting == self.parties:
+            self._num_waiting = 0
+            self._event = asyncio.Event()
+            event.set()
+        else:
+            await event.wait()
+
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+class TestBarrier(unittest.TestCase):
+    def test_reuse(self):
+        async def run() -> list:
+            barrier = Barrier(3)
+            passed = []
+
+            async def party(num: int) -> None:
+                for round_ in range(2):
+                    await barrier.wait()
+                    passed.append((round_, num))
+
+            await asyncio.gather(*(party(num) for num in range(3)))
+            self.assertEqual(barrier.n_waiting, 0)
+            return passed
+
+        passed = asyncio.run(run())
+        self.assertEqual([round_ for round_, _ in passed], [0, 0, 0, 1, 1, 1])
+
+
+# python -m unittest -v ircrssfeedbot.util.asyncio
@@ -1,11 +1,18 @@
 """bs4 utilities."""
+import functools
+import html
 import unittest
 
 from bs4 import BeautifulSoup
 
+from ..config import CACHE_MAXSIZE__HTML_TO_TEXT
 
+
+@functools.lru_cache(CACHE_MAXSIZE__HTML_TO_TEXT)  # Titles and summaries are often unchanged across reads of a feed.
 def html_to_text(text: str) -> str:
     """Return extracted text from the given HTML string."""
+    if "<" not in text:  # Common for titles. Only character references, if any, then need to be handled.
+        return html.unescape(text) if ("&" in text) else text
     # Ref: https://stackoverflow.com/a/34532382/
     return BeautifulSoup(text, features="html.parser").get_text()
 
@@ -15,13 +22,15 @@ class TestHtmlToText(unittest.TestCase):
     def test_examples(self):
         examples = {
             "<b>Hello world!</b>": "Hello world!",
+            "Hello world!": "Hello world!",
+            "Tom &amp; Jerry&#39;s AT&T": "Tom & Jerry's AT&T",
             '<a href="google.com">some text</a>': "some text",
             '<span class="small-caps">l</span>-arginine minimizes immunosuppression and prothrombin time and enhances the genotoxicity of 5-fluorouracil in rats': "l-arginine minimizes immunosuppression and prothrombin time and enhances the genotoxicity of 5-fluorouracil in rats",
             "Attenuation of diabetic nephropathy by dietary fenugreek (<em>Trigonella foenum-graecum</em>) seeds and onion (<em>Allium cepa</em>) <em>via</em> suppression of glucose transporters and renin-angiotensin system": "Attenuation of diabetic nephropathy by dietary fenugreek (Trigonella foenum-graecum) seeds and onion (Allium cepa) via suppression of glucose transporters and renin-angiotensin system",
         }
-        for html, expected_text in examples.items():
-            with self.subTest(html=html):
-                self.assertEqual(expected_text, html_to_text(html))
+        for html_text, expected_text in examples.items():
+            with self.subTest(html=html_text):
+                self.assertEqual(expected_text, html_to_text(html_text))
 
 
 # python -m unittest -v ircrssfeedbot.util.bs4
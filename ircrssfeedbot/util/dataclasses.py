@@ -0,0 +1,49 @@
+"""dataclasses utilities."""
+import dataclasses
+import unittest
+from typing import List, Optional, cast
+
+
+def add_slots(cls: type) -> type:
+    """Return a copy of the given dataclass having `__slots__` for its fields.
+
+    This is similar to `dataclass(slots=True)` which is available only in Python>=3.10.
+    Fields having `init=False` must not have a default value, as it would be lost with its class attribute.
+    """
+    assert dataclasses.is_dataclass(cls) and ("__slots__" not in cls.__dict__)
+    fields = dataclasses.fields(cls)
+    assert all(field.init or ((field.default is dataclasses.MISSING) and (field.default_factory is dataclasses.MISSING)) for field in fields)
+    field_names = tuple(field.name for field in fields)
+    cls_dict = {k: v for k, v in cls.__dict__.items() if k not in (*field_names, "__dict__", "__weakref__")}
+    cls_dict["__slots__"] = field_names
+    metaclass = cast(type, type(cls))
+    slotted_cls = metaclass(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
+
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+class TestAddSlots(unittest.TestCase):
+    def test_slots(self):
+        @add_slots
+        @dataclasses.dataclass(unsafe_hash=True)
+        class Item:
+            key: str = dataclasses.field(compare=True)
+            values: List[int] = dataclasses.field(compare=False, repr=False)
+            note: Optional[str] = dataclasses.field(init=False, compare=False)
+
+            def __post_init__(self):
+                self.note = None
+
+        item = Item("a", [1])
+        self.assertFalse(hasattr(item, "__dict__"))
+        self.assertIsNone(item.note)
+        item.note = "b"
+        self.assertEqual(item, Item("a", [2]))
+        self.assertEqual(hash(item), hash(Item("a", [])))
+        self.assertTrue(repr(item).endswith("Item(key='a', note='b')"))
+        with self.assertRaises(AttributeError):
+            item.other = None  # type: ignore  # pylint: disable=attribute-defined-outside-init
+
+
+# python -m unittest -v ircrssfeedbot.util.dataclasses
@@ -17,7 +17,10 @@ def hash4(content: Union[bytes, str]) -> str:
 
 
 class Int8Hash:
-    """8 byte signed integer hash of string."""
+    """8 byte signed integer hash of string.
+
+    The hashes are persisted in the database, and so the hash function must never be changed.
+    """
 
     BYTES = 8
     BITS = BYTES * 8
@@ -25,25 +28,28 @@ class Int8Hash:
     MIN = -(2 ** BITS_MINUS1)
     MAX = 2 ** BITS_MINUS1 - 1
 
-    @classmethod
-    def as_dict(cls, texts: List[str]) -> Dict[int, str]:
+    @staticmethod
+    def as_dict(texts: List[str]) -> Dict[int, str]:
         """Return a mapping of integer hashes corresponding to the given list of strings."""
-        return {cls.as_int(text): text for text in texts}  # Intentionally Dict[int, str], not Dict[str, int].
+        return dict(zip(map(_int8hash, texts), texts))  # Intentionally Dict[int, str], not Dict[str, int].
 
-    @classmethod
-    @functools.lru_cache(CACHE_MAXSIZE__INT8HASH)
-    def as_int(cls, text: str) -> int:
+    @staticmethod
+    def as_int(text: str) -> int:
         """Return an integer hash of a string."""
-        seed = text.encode()
-        hash_digest = hashlib.shake_128(seed).digest(cls.BYTES)  # pylint: disable=too-many-function-args
-        hash_int = int.from_bytes(hash_digest, byteorder="big", signed=True)
-        assert cls.MIN <= hash_int <= cls.MAX
-        return hash_int
-
-    @classmethod
-    def as_list(cls, texts: List[str]) -> List[int]:
+        return _int8hash(text)
+
+    @staticmethod
+    def as_list(texts: List[str]) -> List[int]:
         """Return a list of integer hashes corresponding to the given list of strings."""
-        return [cls.as_int(text) for text in texts]
+        return list(map(_int8hash, texts))
+
+
+@functools.lru_cache(CACHE_MAXSIZE__INT8HASH)  # Module-level function avoids the overhead of a cached classmethod for each text.
+def _int8hash(text: str) -> int:
+    hash_digest = hashlib.shake_128(text.encode()).digest(Int8Hash.BYTES)  # pylint: disable=too-many-function-args
+    hash_int = int.from_bytes(hash_digest, byteorder="big", signed=True)
+    assert Int8Hash.MIN <= hash_int <= Int8Hash.MAX
+    return hash_int
 
 
 # pylint: disable=missing-class-docstring,missing-function-docstring
@@ -57,5 +63,11 @@ class TestInt8Hash(unittest.TestCase):
             self.assertLessEqual(Int8Hash.MIN, int8)
             self.assertGreaterEqual(Int8Hash.MAX, int8)
 
+    def test_stability(self):
+        examples = {"": 9195272526460060285, "#some-channel": -8694595797683165650, "https://example.com/": -7030383918487847750}
+        for text, expected_int8 in examples.items():
+            with self.subTest(text=text):
+                self.assertEqual(expected_int8, Int8Hash.as_int(text))
+
 
 # python -m unittest -v ircrssfeedbot.util.hashlib
@@ -0,0 +1,104 @@
+"""re utilities."""
+import re
+import unittest
+from typing import Iterable, List, Match, Optional, Pattern
+
+_NUMBERED_GROUP_REFERENCE_RE = re.compile(r"\\[1-9]|\(\?\(\d")
+
+
+class MultiPattern:
+    """Search text using a list of compiled regular expression patterns.
+
+    The patterns are fused into a single alternation if this can be done safely, so that text is searched only once if it doesn't match.
+    The first of the patterns which matches a text is returned for it, irrespective of the position of the match.
+    """
+
+    def __init__(self, patterns: List[Pattern]):
+        self.patterns = patterns
+        self._fused_pattern = self._fuse(patterns)
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    @staticmethod
+    def _fuse(patterns: List[Pattern]) -> Optional[Pattern]:
+        """Return a single pattern which is an alternation of the given patterns, or None if they are not to be fused."""
+        if len(patterns) < 2:
+            return None
+        if any((p.flags != re.UNICODE) or (p.groups and _NUMBERED_GROUP_REFERENCE_RE.search(p.pattern)) for p in patterns):
+            return None  # Global inline flags and numbered group references don't survive fusion.
+        try:
+            return re.compile("|".join(f"(?P<g{i}>{p.pattern})" for i, p in enumerate(patterns)))
+        except re.error:  # e.g. if the same group name is used in multiple patterns.
+            return None
+
+    def search(self, text: str) -> Optional[Pattern]:
+        """Return a pattern which matches the given text, if any."""
+        if (fused_pattern := self._fused_pattern) is None:
+            for pattern in self.patterns:
+                if pattern.search(text):
+                    return pattern
+            return None
+        if match := fused_pattern.search(text):
+            return self._first_matching_pattern(text, match)
+        return None
+
+    def _first_matching_pattern(self, text: str, fused_match: Match) -> Pattern:
+        """Return the first pattern which matches the given text, given a match of the fused pattern for it.
+
+        The fused match is of the pattern having the leftmost match, and so only the preceding patterns are searched.
+        """
+        index = int(fused_match.lastgroup[1:])  # type: ignore
+        patterns = self.patterns
+        for pattern in patterns[:index]:
+            if pattern.search(text):
+                return pattern
+        return patterns[index]
+
+    def search_many(self, texts: Iterable[str]) -> List[Optional[Pattern]]:
+        """Return a list of the pattern which matches each of the given texts, if any."""
+        if (fused_pattern := self._fused_pattern) is None:
+            search = self.search
+            return [search(text) for text in texts]
+        fused_search, first_matching_pattern = fused_pattern.search, self._first_matching_pattern
+        return [(first_matching_pattern(text, match) if (match := fused_search(text)) else None) for text in texts]
+
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+class TestMultiPattern(unittest.TestCase):
+    def test_fused(self):
+        patterns = [re.compile(p) for p in (r"\bfoo\b", r"(ba)r", r"(?P<name>baz)", "(?i:qux)")]
+        multipattern = MultiPattern(patterns)
+        self.assertIsNotNone(multipattern._fused_pattern)  # pylint: disable=protected-access
+        examples = {"a foo": patterns[0], "food": None, "bar": patterns[1], "bazaar": patterns[2], "QUX": patterns[3], "": None}
+        for text, expected_pattern in examples.items():
+            with self.subTest(text=text):
+                self.assertIs(expected_pattern, multipattern.search(text))
+        self.assertEqual(list(examples.values()), multipattern.search_many(examples))
+
+    def test_fused_order(self):
+        patterns = [re.compile(p) for p in ("world", "hello", "o")]
+        multipattern = MultiPattern(patterns)
+        self.assertIsNotNone(multipattern._fused_pattern)  # pylint: disable=protected-access
+        examples = {"hello world": patterns[0], "hello": patterns[1], "foo": patterns[2], "bar": None}
+        for text, expected_pattern in examples.items():
+            with self.subTest(text=text):
+                self.assertIs(expected_pattern, multipattern.search(text))
+        self.assertEqual(list(examples.values()), multipattern.search_many(examples))
+
+    def test_unfused(self):
+        for pattern_strs in ((r"(a)\1", "b"), ("(?i)a", "b"), ("(?P<x>a)", "(?P<x>b)"), ("a",)):
+            with self.subTest(patterns=pattern_strs):
+                patterns = [re.compile(p) for p in pattern_strs]
+                multipattern = MultiPattern(patterns)
+                self.assertIsNone(multipattern._fused_pattern)  # pylint: disable=protected-access
+                self.assertIs(patterns[0], multipattern.search("aa"))
+                self.assertIsNone(multipattern.search("c"))
+
+    def test_empty(self):
+        multipattern = MultiPattern([])
+        self.assertFalse(multipattern)
+        self.assertIsNone(multipattern.search("a"))
+
+
+# python -m unittest -v ircrssfeedbot.util.re
@@ -4,6 +4,8 @@ import io
 import logging
 import sqlite3
 import string
+import unittest
+from typing import List
 
 from luqum.parser import parser
 from luqum.tree import AndOperation
@@ -18,6 +20,7 @@ _UNSAFE_QUERY_CHARS = set(string.punctuation) - _SAFE_QUERY_CHARS
 
 class _SearchFieldRemover(LuceneTreeTransformer):
     def visit_search_field(self, node, parents):  # pylint: disable=unused-argument,no-self-use
+        """Remove the search field node."""
         return None
 
 
@@ -28,6 +31,9 @@ class SqliteFTS5Matcher:
         self._query = self._convert_github_query_to_sqlite_fts5_query(query)
         if query != self._query:
             log.info(f"Adjusted the query {query!r} for local validation to {self._query!r}.")
+        # Docs: https://www.sqlite.org/fts5.html
+        self._db = sqlite3.connect(":memory:")  # Created once, and reused for all matches.
+        self._db.execute("CREATE VIRTUAL TABLE t USING fts5(c);")
 
     @staticmethod
     def _convert_github_query_to_sqlite_fts5_query(query: str) -> str:
@@ -45,15 +51,36 @@ class SqliteFTS5Matcher:
         query = query.replace(" AND NOT ", " NOT ")  # Approximate workaround for sqlite3.OperationalError: fts5: syntax error near "NOT"
         return query
 
+    def are_matches(self, texts: List[str]) -> List[bool]:
+        """Return whether each of the given text strings is a match for the query.
+
+        The texts are matched together using a single query.
+        """
+        with self._db:
+            self._db.execute("DELETE FROM t;")
+            self._db.executemany("INSERT INTO t(rowid, c) VALUES(?, ?);", enumerate(texts))
+            try:
+                results_cursor = self._db.execute("SELECT rowid FROM t WHERE t MATCH ?;", (self._query,))
+            except sqlite3.OperationalError as exception:
+                raise sqlite3.OperationalError(f"{exception} (with query {self._query!r})")
+            matching_rowids = {rowid for (rowid,) in results_cursor}
+        return [rowid in matching_rowids for rowid in range(len(texts))]
+
     def is_match(self, text: str) -> bool:
         """Return whether the given text string is a match for the query."""
-        # Docs: https://www.sqlite.org/fts5.html
-        db = sqlite3.connect(":memory:")
-        cursor = db.cursor()
-        cursor.execute("CREATE VIRTUAL TABLE t USING fts5(c);")
-        cursor.execute("INSERT INTO t VALUES(?);", (text,))
-        try:
-            results_cursor = cursor.execute("SELECT * FROM t WHERE t MATCH ?;", (self._query,))
-        except sqlite3.OperationalError as exception:
-            raise sqlite3.OperationalError(f"{exception} (with query {self._query!r})")
-        return bool(results_cursor.fetchall())
+        return self.are_matches([text])[0]
+
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+class TestSqliteFTS5Matcher(unittest.TestCase):
+    def test_are_matches(self):
+        matcher = SqliteFTS5Matcher("foo bar NOT baz path:/#some-channel")
+        texts = ["foo bar", "bar qux foo", "foo baz bar", "foo", ""]
+        expected_matches = [True, True, False, False, False]
+        self.assertEqual(matcher.are_matches(texts), expected_matches)
+        self.assertEqual(matcher.are_matches(texts[::-1]), expected_matches[::-1])
+        self.assertEqual([matcher.is_match(text) for text in texts], expected_matches)
+        self.assertEqual(matcher.are_matches([]), [])
+
+
+# python -m unittest -v ircrssfeedbot.util.sqlite3
@@ -1,23 +1,44 @@
 """time utilities."""
+import threading
 import time
+import unittest
 
 
-class Throttle:
-    """Provide a context manager which uses at least the given number of seconds."""
+class TokenBucket:
+    """Thread-safe token bucket rate limiter which permits bursts of up to the given capacity."""
 
-    class Break(Exception):
-        """Raise this exception to disable the requirement of using at least the given number of seconds."""
+    __slots__ = ("_capacity", "_lock", "_rate", "_time", "_tokens")
 
-    def __init__(self, seconds: int):
-        self._seconds = seconds
+    def __init__(self, rate: float, capacity: int):
+        self._capacity = capacity
+        self._rate = rate  # Tokens per second.
+        self._tokens = float(capacity)
+        self._time = time.monotonic()
+        self._lock = threading.Lock()
 
-    def __enter__(self):
-        self._start_time = time.monotonic()  # pylint: disable=attribute-defined-outside-init
-        return self
+    def acquire(self) -> None:
+        """Consume a token, sleeping until it is available if necessary."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._time) * self._rate)
+            self._time = now
+            self._tokens -= 1  # May become negative, thereby reserving a future token without holding the lock while sleeping.
+            sleep_time = max(0.0, -self._tokens / self._rate)
+        if sleep_time > 0:
+            time.sleep(sleep_time)
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        if exc_type == self.Break:
-            return True
-        sleep_time = max(0.0, self._start_time + self._seconds - time.monotonic())
-        time.sleep(sleep_time)
-        return None
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+class TestTokenBucket(unittest.TestCase):
+    def test_burst(self):
+        bucket = TokenBucket(rate=20, capacity=3)
+        start_time = time.monotonic()
+        for _ in range(3):
+            bucket.acquire()
+        self.assertLess(time.monotonic() - start_time, 0.04)
+        for _ in range(2):
+            bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start_time, 0.09)
+
+
+# python -m unittest -v ircrssfeedbot.util.time
@@ -1,5 +1,6 @@
 """urllib utilities."""
 import functools
+import unittest
 import urllib.parse
 
 from ..config import CACHE_MAXSIZE__URL_NETLOC
@@ -7,12 +8,50 @@ from ..config import CACHE_MAXSIZE__URL_NETLOC
 
 @functools.lru_cache(CACHE_MAXSIZE__URL_NETLOC)
 def url_to_netloc(url: str) -> str:
-    """Return the netloc for the given URL."""
-    parse_result = urllib.parse.urlparse(url)
-    if parse_result.scheme == "":
-        url = f"https://{url}"  # Without this, the returned netloc is erroneous.
-        parse_result = urllib.parse.urlparse(url)
-    netloc = parse_result.netloc.casefold()
+    """Return the netloc for the given URL.
+
+    The URL is split using `str.partition` which is much faster than `urllib.parse.urlparse`.
+    """
+    scheme, separator, netloc_path = url.partition("://")
+    if (not separator) or ("/" in scheme) or ("?" in scheme) or ("#" in scheme):  # The URL has no scheme, e.g. "example.com/?u=http://x".
+        netloc_path = url
+    netloc = netloc_path.partition("/")[0].partition("?")[0].partition("#")[0].casefold()
     if netloc.startswith("www."):
         netloc = netloc[4:]
     return netloc
+
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+class TestURLToNetloc(unittest.TestCase):
+    @staticmethod
+    def _url_to_netloc_via_urlparse(url: str) -> str:
+        parse_result = urllib.parse.urlparse(url)
+        if parse_result.scheme == "":
+            parse_result = urllib.parse.urlparse(f"https://{url}")
+        netloc = parse_result.netloc.casefold()
+        return netloc[4:] if netloc.startswith("www.") else netloc
+
+    def test_url_to_netloc(self):
+        urls = {
+            "https://www.example.com/": "example.com",
+            "https://Example.com": "example.com",
+            "http://example.com:8080/path/to/feed.xml": "example.com:8080",
+            "https://sub.example.com/feed?query=a/b#fragment": "sub.example.com",
+            "https://example.com?query=a/b": "example.com",
+            "https://example.com#fragment/a": "example.com",
+            "https://user@example.com/path": "user@example.com",
+            "www.example.com/path": "example.com",
+            "example.com": "example.com",
+            "example.com/?u=http://x": "example.com",
+            "example.com#http://x": "example.com",
+            "https://example.com/?u=http://x": "example.com",
+            "https://www2.example.com/": "www2.example.com",
+            "https://export.arxiv.org/rss/cs.AI": "export.arxiv.org",
+        }
+        for url, expected_netloc in urls.items():
+            with self.subTest(url=url):
+                self.assertEqual(url_to_netloc.__wrapped__(url), expected_netloc)
+                self.assertEqual(self._url_to_netloc_via_urlparse(url), expected_netloc)
+
+
+# python -m unittest -v ircrssfeedbot.util.urllib